@@ -0,0 +1,110 @@
+"""Check the import time of the integration and its platforms against a budget.
+
+Imports each module in a fresh interpreter with ``python -X importtime``,
+after pre-importing the Home Assistant modules that are always loaded when
+the integration is set up, so only the cost added by the integration counts.
+
+    python benchmarks/import_time.py --budget-ms 50
+
+Results are printed as JSON. The exit status is 1 if a module exceeds the
+budget or if importing the integration loads a module that must stay lazy.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+PACKAGE = "custom_components.weatherxm"
+
+# Loaded by Home Assistant before any integration is set up
+BASELINE = (
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.aiohttp_client",
+    "homeassistant.helpers.entity",
+    "homeassistant.helpers.event",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.components.sensor",
+    "homeassistant.components.weather",
+    "homeassistant.components.geo_location",
+)
+
+TARGETS = (
+    PACKAGE,
+    f"{PACKAGE}.config_flow",
+    f"{PACKAGE}.sensor",
+    f"{PACKAGE}.weather",
+    f"{PACKAGE}.geo_location",
+)
+
+# Only imported once an option needs them
+LAZY = (
+    "sqlite3",
+    f"{PACKAGE}.history",
+    f"{PACKAGE}.statistics",
+)
+
+
+def import_time(module: str) -> tuple[float, set[str]]:
+    """Return the cumulative import time of module in ms and the modules it loaded."""
+    code = "".join(f"import {name};" for name in BASELINE) + f"import {module}"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Lines look like "import time:  self [us] | cumulative | imported package",
+    # children are listed before their parent and the baseline before module.
+    loaded = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        loaded.append((name.strip(), int(cumulative)))
+
+    baseline_end = max(
+        index for index, (name, _) in enumerate(loaded) if name.lstrip() in BASELINE
+    )
+    added = loaded[baseline_end + 1:]
+    cumulative = next(us for name, us in reversed(added) if name == module)
+    return cumulative / 1000, {name for name, _ in added}
+
+
+def main() -> None:
+    """Run the check."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=50, help="allowed import time per module")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per module, the fastest counts")
+    args = parser.parse_args()
+
+    results = {}
+    failed = False
+    for module in TARGETS:
+        runs = [import_time(module) for _ in range(args.repeat)]
+        elapsed = min(ms for ms, _ in runs)
+        loaded = runs[0][1]
+        lazy = sorted(name for name in LAZY if name in loaded) if module == PACKAGE else []
+        over = elapsed > args.budget_ms
+        failed = failed or over or bool(lazy)
+        results[module] = {
+            "import_ms": round(elapsed, 2),
+            "modules_loaded": len(loaded),
+            "over_budget": over,
+            "eager_lazy_modules": lazy,
+        }
+
+    print(json.dumps({"budget_ms": args.budget_ms, "modules": results}, indent=2))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Compare the JSON decoders available to the WeatherXM API client.
+
+Builds a synthetic 7-day forecast payload shaped like the
+``me/devices/{id}/forecast`` response and times each decoder on it.
+
+    python benchmarks/json_decoders.py --days 7 --repeat 200
+
+Results are printed as JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from datetime import datetime, timedelta, timezone
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def forecast_payload(days: int) -> bytes:
+    """Return a forecast body for the given number of days."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    payload = []
+    for day in range(days):
+        date = start + timedelta(days=day)
+        payload.append({
+            "date": date.date().isoformat(),
+            "tz": "UTC",
+            "daily": {
+                "timestamp": date.isoformat(),
+                "icon": "partly-cloudy-day",
+                "temperature_max": 18.4,
+                "temperature_min": 9.1,
+                "humidity": 71,
+                "pressure": 1014.2,
+                "precipitation_intensity": 0.3,
+                "precipitation_probability": 40,
+                "uv_index": 4,
+                "wind_speed": 3.2,
+                "wind_direction": 210,
+            },
+            "hourly": [
+                {
+                    "timestamp": (date + timedelta(hours=hour)).isoformat(),
+                    "icon": "partly-cloudy-day",
+                    "temperature": 12.0 + hour / 4,
+                    "feels_like": 11.2 + hour / 4,
+                    "humidity": 70,
+                    "pressure": 1014.0,
+                    "precipitation": 0.1,
+                    "precipitation_probability": 30,
+                    "uv_index": 2,
+                    "wind_speed": 3.0,
+                    "wind_direction": 200,
+                }
+                for hour in range(24)
+            ],
+        })
+    return json.dumps(payload).encode()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=7, help="forecast days in the payload")
+    parser.add_argument("--repeat", type=int, default=200, help="decodes per decoder")
+    args = parser.parse_args()
+
+    body = forecast_payload(args.days)
+    decoders = {"json": json.loads}
+    if orjson is not None:
+        decoders["orjson"] = orjson.loads
+
+    results = {}
+    for name, decoder in decoders.items():
+        best = min(timeit.repeat(lambda: decoder(body), number=args.repeat, repeat=5))
+        results[name] = {"per_decode_us": round(best / args.repeat * 1e6, 2)}
+
+    print(json.dumps({"payload_bytes": len(body), "decoders": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+"""Benchmark the refresh pipeline against a local stand-in for the WeatherXM API.
+
+Starts an aiohttp server answering ``auth/login``, ``auth/refresh``,
+``me/devices`` and ``me/devices/{id}/forecast`` with synthetic payloads,
+points the integration's API client and coordinators at it and measures:
+
+- wall time of ``_async_update_data`` for the device and forecast coordinators,
+- the cost of computing and writing the state of one entity, per platform module,
+- peak memory allocated while refreshing and while writing states.
+
+    python benchmarks/refresh_pipeline.py --devices 50 --latency 20 --rounds 10
+
+Requires Home Assistant and aiohttp (a Home Assistant development
+environment). Results are printed as JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import timedelta
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from json_decoders import forecast_payload  # noqa: E402
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.weatherxm.battery import WeatherXMBatteryLevelSensor  # noqa: E402
+from custom_components.weatherxm.coordinator import (  # noqa: E402
+    WeatherXMDeviceCoordinator,
+    WeatherXMForecastCoordinator,
+)
+from custom_components.weatherxm.firmware import WeatherXMFirmwareSensor  # noqa: E402
+from custom_components.weatherxm.geo_location import WeatherXMGeolocation  # noqa: E402
+from custom_components.weatherxm.last_update import WeatherXMLastUpdateSensor  # noqa: E402
+from custom_components.weatherxm.rewards import (  # noqa: E402
+    WeatherXMRewardsSensor,
+    WeatherXMTotalRewardsSensor,
+)
+from custom_components.weatherxm.weather import WeatherXMWeather  # noqa: E402
+from custom_components.weatherxm.weatherxm_api import TokenBucket, WeatherXMAPI  # noqa: E402
+
+
+def _token(lifetime: int = 3600) -> str:
+    """Return an unsigned JWT that expires after lifetime seconds."""
+    def encode(data: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+    return f"{encode({'alg': 'none'})}.{encode({'exp': int(time.time()) + lifetime})}.bench"
+
+
+def device_payload(index: int, padding: int) -> dict:
+    """Return one me/devices entry, padded with an unused attribute."""
+    return {
+        "id": f"device-{index:05d}",
+        "name": f"Bench Station {index}",
+        "relation": "owned",
+        "address": f"Street {index}",
+        "bat_state": "good",
+        "attributes": {
+            "friendlyName": f"Bench {index}",
+            "isActive": True,
+            "lastWeatherStationActivity": "2024-01-01T12:00:00+00:00",
+            "firmware": {"current": "2.3.1", "assigned": "2.3.1"},
+            "padding": "x" * padding,
+        },
+        "location": {"lat": 37.9 + index / 1000, "lon": 23.7 + index / 1000},
+        "rewards": {"actual_reward": 1.25, "total_rewards": 100.0 + index},
+        "current_weather": {
+            "timestamp": "2024-01-01T12:00:00+00:00",
+            "icon": "partly-cloudy-day",
+            "temperature": 14.2,
+            "feels_like": 13.1,
+            "dew_point": 8.4,
+            "humidity": 68,
+            "pressure": 1013.6,
+            "precipitation": 0.0,
+            "precipitation_accumulated": 1.2,
+            "solar_irradiance": 412,
+            "uv_index": 3,
+            "wind_speed": 2.7,
+            "wind_gust": 5.1,
+            "wind_direction": 220,
+        },
+    }
+
+
+def mock_server(devices: int, latency: float, padding: int, forecast_days: int) -> web.Application:
+    """Return an application serving the API endpoints used by the integration."""
+    devices_body = json.dumps([device_payload(index, padding) for index in range(devices)]).encode()
+    forecast_body = forecast_payload(forecast_days)
+    # Never let the client cache serve a round from memory
+    headers = {"Cache-Control": "no-store", "Content-Type": "application/json"}
+
+    @web.middleware
+    async def delay(request: web.Request, handler):
+        if latency:
+            await asyncio.sleep(latency)
+        return await handler(request)
+
+    async def login(request: web.Request) -> web.Response:
+        return web.json_response({"token": _token(), "refreshToken": "bench-refresh"})
+
+    async def me_devices(request: web.Request) -> web.Response:
+        return web.Response(body=devices_body, headers=headers)
+
+    async def forecast(request: web.Request) -> web.Response:
+        return web.Response(body=forecast_body, headers=headers)
+
+    app = web.Application(middlewares=[delay])
+    app.router.add_post("/api/v1/auth/login", login)
+    app.router.add_post("/api/v1/auth/refresh", login)
+    app.router.add_get("/api/v1/me/devices", me_devices)
+    app.router.add_get("/api/v1/me/devices/{device_id}/forecast", forecast)
+    return app
+
+
+def _summary(samples: list[float], scale: float) -> dict[str, float]:
+    """Return min, median and max of samples, multiplied by scale."""
+    return {
+        "min": round(min(samples) * scale, 3),
+        "median": round(statistics.median(samples) * scale, 3),
+        "max": round(max(samples) * scale, 3),
+    }
+
+
+async def _timed(coro) -> tuple[float, object]:
+    """Await coro, returning its wall time in seconds and its result."""
+    start = time.perf_counter()
+    result = await coro
+    return time.perf_counter() - start, result
+
+
+def platform_entities(hass: HomeAssistant, coordinator, forecast_coordinator) -> dict[str, list]:
+    """Create the entities of every platform module for all devices."""
+    entities = {
+        "battery": [], "rewards": [], "total_rewards": [], "firmware": [],
+        "last_update": [], "geo_location": [], "weather": [],
+    }
+    for index, device in enumerate(coordinator.data.values()):
+        alias = device.alias
+        entities["battery"].append(WeatherXMBatteryLevelSensor(
+            coordinator, device.id, alias, device.bat_state, device.is_active
+        ))
+        entities["rewards"].append(WeatherXMRewardsSensor(
+            coordinator, device.id, alias, device.rewards.actual_reward, device.rewards.total_rewards
+        ))
+        entities["total_rewards"].append(WeatherXMTotalRewardsSensor(
+            coordinator, device.id, alias, device.rewards.total_rewards
+        ))
+        entities["firmware"].append(WeatherXMFirmwareSensor(coordinator, device.id, alias, device.firmware))
+        entities["last_update"].append(WeatherXMLastUpdateSensor(coordinator, device.id, alias))
+        entities["geo_location"].append(WeatherXMGeolocation(
+            coordinator, f"geo_location.bench_{index}", device.id, alias,
+            device.location, device.last_activity, device.current_weather,
+        ))
+        entities["weather"].append(WeatherXMWeather(
+            coordinator, forecast_coordinator, f"weather.bench_{index}", device.id, alias, device.address
+        ))
+
+    for module, module_entities in entities.items():
+        for index, entity in enumerate(module_entities):
+            entity.hass = hass
+            if entity.entity_id is None:
+                entity.entity_id = f"sensor.bench_{module}_{index}"
+    return entities
+
+
+def write_states(hass: HomeAssistant, entities: list) -> float:
+    """Compute and write the state of every entity, returning the wall time."""
+    start = time.perf_counter()
+    for entity in entities:
+        state = entity._async_calculate_state()
+        hass.states.async_set(entity.entity_id, state.state, state.attributes)
+    return time.perf_counter() - start
+
+
+async def run(args: argparse.Namespace) -> dict:
+    """Run the benchmark and return its results."""
+    app = mock_server(args.devices, args.latency / 1000, args.padding, args.forecast_days)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            from homeassistant.helpers import frame
+            frame.async_setup(hass)
+        except (ImportError, AttributeError):
+            pass
+
+        rate = args.rate_limit or 1e9
+        api = WeatherXMAPI(
+            f"http://127.0.0.1:{port}",
+            rate_limiter=TokenBucket(rate=rate, capacity=max(args.devices + 1, 10)),
+        )
+        coordinator = WeatherXMDeviceCoordinator(hass, api)
+        forecast_coordinator = WeatherXMForecastCoordinator(
+            hass, api, coordinator, update_interval=timedelta(hours=1), concurrency=args.concurrency
+        )
+        await api.authenticate("bench", "bench")
+
+        devices_times, forecasts_times = [], []
+        tracemalloc.start()
+        for _ in range(args.rounds):
+            elapsed, coordinator.data = await _timed(coordinator._async_update_data())
+            devices_times.append(elapsed)
+            elapsed, forecast_coordinator.data = await _timed(forecast_coordinator._async_update_data())
+            forecasts_times.append(elapsed)
+        refresh_peak = tracemalloc.get_traced_memory()[1]
+
+        tracemalloc.reset_peak()
+        entities = platform_entities(hass, coordinator, forecast_coordinator)
+        state_writes = {}
+        for module, module_entities in entities.items():
+            samples = [write_states(hass, module_entities) for _ in range(args.rounds)]
+            state_writes[module] = _summary([sample / len(module_entities) for sample in samples], 1e6)
+
+        forecast_samples = []
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            for entity in entities["weather"]:
+                entity._forecast_cache.clear()
+                await entity.async_forecast_hourly()
+                await entity.async_forecast_daily()
+            forecast_samples.append((time.perf_counter() - start) / len(entities["weather"]))
+        entities_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        await api.close()
+        await hass.async_stop(force=True)
+    await runner.cleanup()
+
+    return {
+        "config": vars(args),
+        "refresh_ms": {
+            "devices": _summary(devices_times, 1e3),
+            "forecasts": _summary(forecasts_times, 1e3),
+        },
+        "state_write_us_per_entity": state_writes,
+        "forecast_conversion_us_per_entity": _summary(forecast_samples, 1e6),
+        "peak_memory_kib": {
+            "refresh": round(refresh_peak / 1024, 1),
+            "state_writes": round(entities_peak / 1024, 1),
+        },
+    }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=10, help="stations returned by me/devices")
+    parser.add_argument("--latency", type=float, default=0, help="server latency per request, in ms")
+    parser.add_argument("--padding", type=int, default=0, help="extra bytes per device object")
+    parser.add_argument("--forecast-days", type=int, default=7, help="days in every forecast payload")
+    parser.add_argument("--concurrency", type=int, default=4, help="parallel forecast downloads")
+    parser.add_argument("--rate-limit", type=float, default=0, help="requests per second, 0 for unlimited")
+    parser.add_argument("--rounds", type=int, default=5, help="measured refresh rounds")
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
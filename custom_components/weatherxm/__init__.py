@@ -3,14 +3,20 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .account import (
+    account_key,
+    account_storage_key,
+    async_get_account,
+    async_release_account,
+    token_store,
+)
 from .const import DOMAIN
-from .weatherxm_api import WeatherXMAPI
+from .snapshot import WeatherXMSnapshot
+from .utils import async_remove_stale_devices
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,53 +25,30 @@ PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.WEATHER, Platform.GEO_LOC
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up WeatherXM from a config entry."""
 
-    username = entry.data["username"]
-    password = entry.data["password"]
-    host = entry.data["host"]
-
-    api = WeatherXMAPI(host)
-    if not await api.authenticate(username, password):
+    # Entries of the same account share the API client and coordinators
+    account = async_get_account(hass, entry)
+    try:
+        ready = await account.async_setup()
+    except Exception:
+        await async_release_account(hass, entry)
+        raise
+    if not ready:
+        await async_release_account(hass, entry)
         return False
 
-    async def async_update_data():
-        """Fetch data from API endpoint."""
-        try:
-            _LOGGER.debug("Starting WeatherXM data update")
-            devices = await api.get_devices()
-            for device in devices:
-                _LOGGER.debug("Fetching forecast for device %s", device['id'])
-                device['forecast'] = await api.get_forecast_data(device['id'])
-                _LOGGER.debug(
-                    "Device %s data - Temperature: %s, Humidity: %s, Wind: %s",
-                    device['id'],
-                    device['current_weather'].get('temperature'),
-                    device['current_weather'].get('humidity'),
-                    device['current_weather'].get('wind_speed')
-                )
-            _LOGGER.debug("WeatherXM data update completed successfully")
-            return devices
-        except Exception as err:
-            _LOGGER.error("Error updating WeatherXM data: %s", err)
-            raise UpdateFailed(f"Error communicating with API: {err}")
-
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name="weatherxm",
-        update_method=async_update_data,
-        update_interval=timedelta(minutes=5),
-    )
-
-    await coordinator.async_config_entry_first_refresh()
-
-    hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
-        'coordinator': coordinator,
-        'api': api
+        'coordinator': account.coordinator,
+        'forecast_coordinator': account.forecast_coordinator,
+        'api': account.api,
+        'account': account,
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Stations added to the account get entities through the platforms,
+    # stations that left it are removed without reloading the entry
+    entry.async_on_unload(async_remove_stale_devices(hass, entry))
+
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
     return True
@@ -75,13 +58,29 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        api = hass.data[DOMAIN][entry.entry_id]['api']
-        await api.close()
         hass.data[DOMAIN].pop(entry.entry_id)
+        await async_release_account(hass, entry)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored tokens, snapshot and history once no entry uses the account."""
+    key = account_key(entry)
+    if any(
+        account_key(other) == key
+        for other in hass.config_entries.async_entries(DOMAIN)
+        if other.entry_id != entry.entry_id
+    ):
+        return
+    await token_store(hass, key).async_remove()
+    await WeatherXMSnapshot(hass, account_storage_key(key)).async_remove()
+
+    from .history import async_remove_history
+
+    await async_remove_history(hass, account_storage_key(key))
+
+
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry):
     """Handle options update."""
     await hass.config_entries.async_reload(entry.entry_id)
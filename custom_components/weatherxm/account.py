@@ -0,0 +1,278 @@
+"""API client and coordinators shared by the config entries of an account."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    CONF_FORECAST_CONCURRENCY,
+    CONF_FORECAST_INTERVAL,
+    CONF_IMPORT_HISTORY,
+    CONF_STATISTICS_IMPORT,
+    DEFAULT_FORECAST_CONCURRENCY,
+    DEFAULT_FORECAST_INTERVAL,
+    TOKEN_SAVE_DELAY,
+    TOKEN_STORAGE_VERSION,
+)
+from .coordinator import WeatherXMDeviceCoordinator, WeatherXMForecastCoordinator
+from .snapshot import WeatherXMSnapshot
+from .utils import device_included, forecast_wanted
+from .weatherxm_api import Device, WeatherXMAPI
+
+if TYPE_CHECKING:
+    # Imported when enabled, most accounts never load sqlite3 or the recorder helpers
+    from .history import WeatherXMHistory
+    from .statistics import WeatherXMStatistics
+
+_LOGGER = logging.getLogger(__name__)
+
+ACCOUNTS = "accounts"
+
+
+def account_key(entry: ConfigEntry) -> tuple[str, str]:
+    """Return the key of the account a config entry belongs to."""
+    return (entry.data[CONF_HOST], entry.data[CONF_USERNAME])
+
+
+def account_storage_key(key: tuple[str, str]) -> str:
+    """Return a storage key for an account that does not expose the username."""
+    digest = hashlib.sha256("|".join(key).encode()).hexdigest()[:16]
+    return f"{DOMAIN}.{digest}"
+
+
+def token_store(hass: HomeAssistant, key: tuple[str, str]) -> Store:
+    """Return the store holding the auth tokens of an account."""
+    return Store(hass, TOKEN_STORAGE_VERSION, f"{account_storage_key(key)}.tokens", private=True)
+
+
+class WeatherXMAccount:
+    """One API client, token and pair of coordinators per (host, username).
+
+    Config entries of the same account share this object; each entry only
+    applies its own device filter when creating entities. The account is
+    closed when its last entry is unloaded.
+    """
+
+    def __init__(self, hass: HomeAssistant, key: tuple[str, str]) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.key = key
+        self.entries: dict[str, ConfigEntry] = {}
+        self._setup_lock = asyncio.Lock()
+        self._ready = False
+        self._unsubscribe: list[CALLBACK_TYPE] = []
+        self._background_task: asyncio.Task | None = None
+        self._history: WeatherXMHistory | None = None
+        self._statistics: WeatherXMStatistics | None = None
+
+        self.api = WeatherXMAPI(key[0], session=async_get_clientsession(hass))
+        self.coordinator = WeatherXMDeviceCoordinator(hass, self.api)
+        self.forecast_coordinator = WeatherXMForecastCoordinator(
+            hass,
+            self.api,
+            self.coordinator,
+            update_interval=timedelta(minutes=DEFAULT_FORECAST_INTERVAL),
+            concurrency=DEFAULT_FORECAST_CONCURRENCY,
+            forecast_wanted=self._forecast_wanted,
+        )
+        self._token_store = token_store(hass, key)
+        self._snapshot = WeatherXMSnapshot(hass, account_storage_key(key))
+
+    @property
+    def _password(self) -> str:
+        """Return the password of the most recently added entry still attached."""
+        return next(reversed(self.entries.values())).data[CONF_PASSWORD]
+
+    def _forecast_wanted(self, device: Device) -> bool:
+        """Return True if an entity of any entry consumes the device's forecast."""
+        return any(forecast_wanted(entry, device) for entry in self.entries.values())
+
+    def _devices_with_option(self, option: str) -> list[Device]:
+        """Return the devices included by an entry that enabled an option."""
+        return [
+            device for device in (self.coordinator.data or {}).values()
+            if any(
+                entry.options.get(option, False) and device_included(entry, device)
+                for entry in self.entries.values()
+            )
+        ]
+
+    @callback
+    def _async_fetch_new_forecasts(self) -> None:
+        """Fetch the forecasts of new stations now instead of at the next forecast refresh."""
+        if self.forecast_coordinator.data is None:
+            return
+        device_ids = [
+            device_id for device_id in self.coordinator.added_device_ids
+            if device_id not in self.forecast_coordinator.data
+            and self._forecast_wanted(self.coordinator.data[device_id])
+        ]
+        if device_ids:
+            self.hass.async_create_background_task(
+                self.forecast_coordinator.async_refresh_devices(device_ids),
+                "weatherxm_new_forecasts",
+            )
+
+    def _history_devices(self) -> list[Device]:
+        """Return the devices whose history an entry asked to import."""
+        return self._devices_with_option(CONF_IMPORT_HISTORY)
+
+    def _statistics_devices(self) -> list[Device]:
+        """Return the devices whose values an entry asked to write as statistics."""
+        return self._devices_with_option(CONF_STATISTICS_IMPORT)
+
+    def _update_forecast_settings(self) -> None:
+        """Refresh forecasts as often and as parallel as the most demanding entry asks."""
+        if not self.entries:
+            return
+        self.forecast_coordinator.update_interval = timedelta(minutes=min(
+            entry.options.get(CONF_FORECAST_INTERVAL, DEFAULT_FORECAST_INTERVAL)
+            for entry in self.entries.values()
+        ))
+        self.forecast_coordinator.concurrency = max(
+            entry.options.get(CONF_FORECAST_CONCURRENCY, DEFAULT_FORECAST_CONCURRENCY)
+            for entry in self.entries.values()
+        )
+
+    def add_entry(self, entry: ConfigEntry) -> None:
+        """Attach a config entry."""
+        self.entries.pop(entry.entry_id, None)
+        self.entries[entry.entry_id] = entry
+        self._update_forecast_settings()
+        if self._ready:
+            self._async_start_history()
+            self._async_start_statistics()
+
+    def remove_entry(self, entry: ConfigEntry) -> None:
+        """Detach a config entry, relaxing the forecast settings it asked for."""
+        self.entries.pop(entry.entry_id, None)
+        self._update_forecast_settings()
+
+    def _async_start_history(self) -> None:
+        """Start the history backfill if an entry enabled it."""
+        if self._history is not None or not any(
+            entry.options.get(CONF_IMPORT_HISTORY, False) for entry in self.entries.values()
+        ):
+            return
+        from .history import WeatherXMHistory
+
+        self._history = WeatherXMHistory(
+            self.hass, self.api, account_storage_key(self.key), self._history_devices
+        )
+        self._history.async_start()
+
+    def _async_start_statistics(self) -> None:
+        """Start writing hourly statistics if an entry enabled it."""
+        if self._statistics is not None or not any(
+            entry.options.get(CONF_STATISTICS_IMPORT, False) for entry in self.entries.values()
+        ):
+            return
+        from .statistics import WeatherXMStatistics
+
+        self._statistics = WeatherXMStatistics(self.hass, self.coordinator, self._statistics_devices)
+        self._statistics.async_start()
+
+    async def _async_authenticate(self) -> bool:
+        """Make sure the API client holds a valid token."""
+        if self.api.token_valid or (self.api.has_refresh_token and await self.api.refresh_token()):
+            return True
+        return await self.api.authenticate(self.key[1], self._password)
+
+    async def async_setup(self) -> bool:
+        """Log in and load the first data, once for all entries of the account."""
+        async with self._setup_lock:
+            if self._ready:
+                return True
+
+            # Reuse the tokens of the previous run so startup does not need a login
+            self.api.restore_tokens(await self._token_store.async_load())
+            self.api.on_tokens_updated = lambda: self._token_store.async_delay_save(
+                self.api.export_tokens, TOKEN_SAVE_DELAY
+            )
+
+            restored = await self._snapshot.async_load()
+            if restored:
+                # Populate the entities from the last run and refresh in the background
+                self.coordinator.async_set_updated_data(restored['devices'])
+                self.forecast_coordinator.async_set_updated_data(restored.get('forecasts', {}))
+                self._background_task = self.hass.async_create_background_task(
+                    self._async_refresh_in_background(), "weatherxm_initial_refresh"
+                )
+            else:
+                if not await self._async_authenticate():
+                    return False
+                # The coordinators belong to no entry, so fail setup by hand
+                for coordinator in (self.coordinator, self.forecast_coordinator):
+                    await coordinator.async_refresh()
+                    if not coordinator.last_update_success:
+                        raise ConfigEntryNotReady from coordinator.last_exception
+
+            self._unsubscribe.append(
+                self._snapshot.async_track(self.coordinator, self.forecast_coordinator)
+            )
+            self._unsubscribe.append(
+                self.coordinator.async_add_listener(self._async_fetch_new_forecasts)
+            )
+            self._ready = True
+            self._async_start_history()
+            self._async_start_statistics()
+            return True
+
+    async def _async_refresh_in_background(self) -> None:
+        """Log in if needed and replace the snapshot with live data."""
+        if not await self._async_authenticate():
+            _LOGGER.error("Unable to authenticate with WeatherXM")
+            return
+        await self.coordinator.async_refresh()
+        if self._snapshot.forecasts_age >= self.forecast_coordinator.update_interval.total_seconds():
+            await self.forecast_coordinator.async_refresh()
+
+    async def async_close(self) -> None:
+        """Stop refreshing and release the API client."""
+        if self._background_task:
+            self._background_task.cancel()
+        while self._unsubscribe:
+            self._unsubscribe.pop()()
+        await self.coordinator.async_shutdown()
+        await self.forecast_coordinator.async_shutdown()
+        if self._history:
+            await self._history.async_stop()
+        if self._statistics:
+            await self._statistics.async_stop()
+        await self.api.close()
+
+
+def async_get_account(hass: HomeAssistant, entry: ConfigEntry) -> WeatherXMAccount:
+    """Return the account of a config entry, creating it if needed."""
+    accounts = hass.data.setdefault(DOMAIN, {}).setdefault(ACCOUNTS, {})
+    key = account_key(entry)
+    if key not in accounts:
+        accounts[key] = WeatherXMAccount(hass, key)
+    account = accounts[key]
+    account.add_entry(entry)
+    return account
+
+
+async def async_release_account(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Detach a config entry from its account, closing the account if unused."""
+    accounts = hass.data[DOMAIN][ACCOUNTS]
+    key = account_key(entry)
+    account = accounts.get(key)
+    if account is None:
+        return
+    account.remove_entry(entry)
+    if not account.entries:
+        accounts.pop(key)
+        await account.async_close()
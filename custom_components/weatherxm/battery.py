@@ -1,6 +1,3 @@
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.helpers.entity import DeviceInfo
-
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -8,7 +5,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 
-from .const import DOMAIN
+from .entity import WeatherXMEntity
 
 BATTERY_LEVEL_MAP = {
     "ok": 100.0,
@@ -16,36 +13,25 @@ BATTERY_LEVEL_MAP = {
     "off": 0.0
 }
 
-class WeatherXMBatteryLevelSensor(CoordinatorEntity, SensorEntity):
+class WeatherXMBatteryLevelSensor(WeatherXMEntity, SensorEntity):
     def __init__(self, coordinator, device_id, alias, bat_state, is_active):
-        super().__init__(coordinator)
-        self._device_id = device_id
-        self._alias = alias
+        super().__init__(coordinator, device_id, alias)
         self._attr_name = f"{alias} Battery"
         self._attr_unique_id = f"{alias}_battery"
         self._attr_state_class = SensorDeviceClass.BATTERY
         self._attr_state_class = SensorStateClass.MEASUREMENT
 
-    def _get_device_data(self):
-        """Get device data from coordinator."""
-        if not self.coordinator.data:
-            return None
-        for device in self.coordinator.data:
-            if device['id'] == self._device_id:
-                return device
-        return None
-
     @property
     def _bat_state(self):
         """Get battery state from coordinator data."""
         device = self._get_device_data()
-        return device['bat_state'] if device else None
+        return device.bat_state if device else None
 
     @property
     def _is_active(self):
         """Get active state from coordinator data."""
         device = self._get_device_data()
-        return device['attributes'].get('isActive', False) if device else False
+        return device.is_active if device else False
 
     @property
     def state(self):
@@ -73,13 +59,3 @@ class WeatherXMBatteryLevelSensor(CoordinatorEntity, SensorEntity):
         if not self._is_active:
             return "mdi:battery-alert"
         return "mdi:battery" if self._bat_state == "ok" else "mdi:battery-alert"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=self._alias,
-            manufacturer="WeatherXM",
-            model="Weather Station",
-        )
@@ -7,15 +7,24 @@ from typing import Any
 
 import voluptuous as vol
 
-import requests
-import json
-
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult, OptionsFlow
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-
-from .const import DOMAIN, DEFAULT_HOST, CONF_FILTER_OWNED_DEVICES
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    DOMAIN,
+    DEFAULT_HOST,
+    CONF_FILTER_OWNED_DEVICES,
+    CONF_FORECAST_CONCURRENCY,
+    CONF_FORECAST_INTERVAL,
+    CONF_IMPORT_HISTORY,
+    CONF_STATISTICS_IMPORT,
+    DEFAULT_FORECAST_CONCURRENCY,
+    DEFAULT_FORECAST_INTERVAL,
+)
+from .weatherxm_api import WeatherXMAPI
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,44 +34,26 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
         vol.Required(CONF_USERNAME): str,
         vol.Required(CONF_PASSWORD): str,
         vol.Optional(CONF_FILTER_OWNED_DEVICES, default=False): bool,
+        vol.Optional(CONF_FORECAST_CONCURRENCY, default=DEFAULT_FORECAST_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=20)
+        ),
+        vol.Optional(CONF_FORECAST_INTERVAL, default=DEFAULT_FORECAST_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=15, max=720)
+        ),
+        vol.Optional(CONF_IMPORT_HISTORY, default=False): bool,
+        vol.Optional(CONF_STATISTICS_IMPORT, default=False): bool,
     }
 )
 
-class WeatherXMHub:
-    """WeatherXM class for authentication and device data retrieval."""
-
-    def __init__(self, host: str) -> None:
-        """Initialize."""
-        self.host = host
-
-    def authenticate(self, username: str, password: str) -> bool:
-        """Test if we can authenticate with the host."""
-        headers = {
-            'accept': 'application/json',
-            'Content-Type': 'application/json'
-        }
-        payload = {'username': username, 'password': password}
-        try:
-            r = requests.post(f'{self.host}/api/v1/auth/login', data=json.dumps(payload), headers=headers)
-            if r.status_code == requests.codes.ok:
-                self.auth_token = r.json()['token']
-                return True
-            else:
-                _LOGGER.error("Authentication failed: %s", r.text)
-                return False
-        except requests.RequestException as e:
-            _LOGGER.error("Error during authentication: %s", e)
-            return False
-
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect.
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
-    hub = WeatherXMHub(data[CONF_HOST])
+    api = WeatherXMAPI(data[CONF_HOST], session=async_get_clientsession(hass))
 
-    if not await hass.async_add_executor_job(hub.authenticate, data[CONF_USERNAME], data[CONF_PASSWORD]):
+    if not await api.authenticate(data[CONF_USERNAME], data[CONF_PASSWORD]):
         raise InvalidAuth
 
     return {"title": "WeatherXM Account"}
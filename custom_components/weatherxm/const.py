@@ -2,4 +2,23 @@
 
 DOMAIN = "weatherxm"
 DEFAULT_HOST = "https://api.weatherxm.com"
-CONF_FILTER_OWNED_DEVICES = "filter_owned"
\ No newline at end of file
+CONF_FILTER_OWNED_DEVICES = "filter_owned"
+CONF_FORECAST_CONCURRENCY = "forecast_concurrency"
+DEFAULT_FORECAST_CONCURRENCY = 4
+CONF_FORECAST_INTERVAL = "forecast_interval"
+DEFAULT_FORECAST_INTERVAL = 60
+DEVICES_UPDATE_INTERVAL = 5
+TOKEN_STORAGE_VERSION = 1
+TOKEN_SAVE_DELAY = 1
+SNAPSHOT_STORAGE_VERSION = 3
+SNAPSHOT_SAVE_DELAY = 30
+MIN_DEVICES_UPDATE_INTERVAL = 1
+MAX_DEVICES_UPDATE_INTERVAL = 15
+INACTIVE_DEVICES_UPDATE_INTERVAL = 30
+CONF_IMPORT_HISTORY = "import_history"
+HISTORY_DAYS = 7
+HISTORY_PAGE_DAYS = 3
+HISTORY_UPDATE_INTERVAL = 60
+CONF_STATISTICS_IMPORT = "statistics_import"
+FAILED_DEVICE_RETRY_DELAY = 60
+MAX_DEVICE_FAILURES = 3
@@ -0,0 +1,300 @@
+"""Data update coordinators for the WeatherXM integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+import time
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DEVICES_UPDATE_INTERVAL, FAILED_DEVICE_RETRY_DELAY, MAX_DEVICE_FAILURES
+from .metrics import TimingStats
+from .scheduler import AdaptivePollScheduler
+from .weatherxm_api import Device, Forecast, WeatherXMAPI
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WeatherXMCoordinator(DataUpdateCoordinator[dict[str, Any]], ABC):
+    """Coordinator whose data is keyed by device id.
+
+    After every update, changed_device_ids holds the ids whose data differs
+    from the previous update, so entities can skip writing unchanged state,
+    and added_device_ids and removed_device_ids the ids that appeared or
+    disappeared, so platforms can add or remove entities at runtime.
+    Fetch durations are kept in refresh_stats and the state writes of the
+    entities in state_write_stats, keyed by platform module.
+
+    Devices are fetched and parsed independently. A device that fails keeps
+    its previous data and is retried alone every FAILED_DEVICE_RETRY_DELAY
+    seconds. Failed refreshes and failed retries both count, and its entities
+    become unavailable after MAX_DEVICE_FAILURES failures in a row; a
+    successful fetch resets the count. Retries and full refreshes hold the
+    same lock, and a retry due while a refresh runs is skipped, since the
+    refresh fetches the device anyway.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize."""
+        super().__init__(*args, **kwargs)
+        self.changed_device_ids: set[str] = set()
+        self.added_device_ids: set[str] = set()
+        self.removed_device_ids: set[str] = set()
+        self.refresh_stats = TimingStats()
+        self.state_write_stats: dict[str, TimingStats] = {}
+        self._device_failures: dict[str, int] = {}
+        self._retry_unsub: CALLBACK_TYPE | None = None
+        self._fetch_lock = asyncio.Lock()
+
+    @property
+    def failed_device_ids(self) -> set[str]:
+        """Return the ids of the devices whose last fetch failed."""
+        return set(self._device_failures)
+
+    def device_available(self, device_id: str) -> bool:
+        """Return False once a device failed MAX_DEVICE_FAILURES fetches in a row."""
+        return self._device_failures.get(device_id, 0) < MAX_DEVICE_FAILURES
+
+    def _record_failures(self, failed: Iterable[str]) -> None:
+        """Count consecutive failures of a full refresh and schedule a retry."""
+        self._device_failures = {
+            device_id: self._device_failures.get(device_id, 0) + 1 for device_id in failed
+        }
+        self._schedule_retry()
+
+    def _schedule_retry(self) -> None:
+        """Retry the failed devices that are still available later."""
+        if self._retry_unsub is None and any(
+            failures < MAX_DEVICE_FAILURES for failures in self._device_failures.values()
+        ):
+            self._retry_unsub = async_call_later(
+                self.hass, FAILED_DEVICE_RETRY_DELAY, self._async_retry_failed
+            )
+
+    def _track_changes(self, data: dict[str, Any]) -> None:
+        """Record which devices changed compared to the current data."""
+        previous = self.data or {}
+        self.changed_device_ids = {
+            device_id for device_id in data.keys() | previous.keys()
+            if data.get(device_id) != previous.get(device_id)
+        }
+        self.added_device_ids = data.keys() - previous.keys()
+        self.removed_device_ids = previous.keys() - data.keys()
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data and compute the per-device change set."""
+        async with self._fetch_lock:
+            start = time.perf_counter()
+            try:
+                data = await self._async_fetch_data()
+            finally:
+                self.refresh_stats.record(time.perf_counter() - start)
+            self._track_changes(data)
+            return data
+
+    @callback
+    def async_set_updated_data(self, data: dict[str, Any]) -> None:
+        """Set data manually, marking changed devices."""
+        self._track_changes(data)
+        super().async_set_updated_data(data)
+
+    async def _async_retry_failed(self, _now: datetime) -> None:
+        """Fetch only the failed devices again, without a full refresh."""
+        self._retry_unsub = None
+        if not self._listeners or self._fetch_lock.locked():
+            # A refresh in flight fetches the failed devices anyway
+            return
+        _LOGGER.debug("Retrying %s failed devices", len(self._device_failures))
+        await self.async_refresh_devices(
+            device_id for device_id, failures in self._device_failures.items()
+            if failures < MAX_DEVICE_FAILURES and device_id in (self.data or {})
+        )
+
+    async def async_refresh_devices(self, device_ids: Iterable[str]) -> None:
+        """Fetch only the given devices and merge them into the data.
+
+        The refresh schedule is kept and only the entities of the devices
+        that changed write their state. Failures count like those of a full
+        refresh and are retried later.
+        """
+        device_ids = list(device_ids)
+        if not device_ids:
+            return
+
+        async with self._fetch_lock:
+            results = await asyncio.gather(
+                *(self._async_fetch_device(device_id) for device_id in device_ids),
+                return_exceptions=True,
+            )
+            data = dict(self.data or {})
+            for device_id, result in zip(device_ids, results):
+                if isinstance(result, Exception):
+                    _LOGGER.debug("Fetching device %s failed: %s", device_id, result)
+                    self._device_failures[device_id] = self._device_failures.get(device_id, 0) + 1
+                    continue
+                self._device_failures.pop(device_id, None)
+                data[device_id] = result
+
+            self._track_changes(data)
+            self.data = data
+        self.async_update_listeners()
+        self._schedule_retry()
+
+    async def async_shutdown(self) -> None:
+        """Cancel a pending retry."""
+        if self._retry_unsub:
+            self._retry_unsub()
+            self._retry_unsub = None
+        await super().async_shutdown()
+
+    @abstractmethod
+    async def _async_fetch_data(self) -> dict[str, Any]:
+        """Fetch the data keyed by device id."""
+
+    @abstractmethod
+    async def _async_fetch_device(self, device_id: str) -> Any:
+        """Fetch the data of a single device."""
+
+
+class WeatherXMDeviceCoordinator(WeatherXMCoordinator):
+    """Coordinator for current weather, battery, rewards and firmware.
+
+    Data is a dict of devices keyed by device id. The update interval adapts
+    to the reporting cadence of the stations after every refresh.
+    """
+
+    def __init__(self, hass: HomeAssistant, api: WeatherXMAPI) -> None:
+        """Initialize."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="weatherxm",
+            update_interval=timedelta(minutes=DEVICES_UPDATE_INTERVAL),
+            # Shared by every entry of an account, so bound to none of them
+            config_entry=None,
+        )
+        self.api = api
+        self._scheduler = AdaptivePollScheduler()
+
+    async def _async_fetch_device(self, device_id: str) -> Device:
+        """Fetch a single device."""
+        return await self.api.get_device(device_id)
+
+    async def _async_fetch_data(self) -> dict[str, Device]:
+        """Fetch devices from API endpoint."""
+        try:
+            _LOGGER.debug("Starting WeatherXM devices update")
+            errors: dict[str, Exception] = {}
+            devices = await self.api.get_devices(errors)
+            for device in devices:
+                _LOGGER.debug(
+                    "Device %s data - Temperature: %s, Humidity: %s, Wind: %s",
+                    device.id,
+                    device.current_weather.temperature,
+                    device.current_weather.humidity,
+                    device.current_weather.wind_speed
+                )
+            self.update_interval = self._scheduler.next_interval(devices)
+            _LOGGER.debug(
+                "WeatherXM devices update completed successfully, next update in %s",
+                self.update_interval,
+            )
+            # Index devices by id so entities can resolve their data in O(1)
+            data = {device.id: device for device in devices}
+            # Malformed devices keep their last valid data
+            previous = self.data or {}
+            for device_id in errors:
+                if device_id in previous:
+                    data[device_id] = previous[device_id]
+            self._record_failures(errors)
+            return data
+        except Exception as err:
+            _LOGGER.error("Error updating WeatherXM data: %s", err)
+            raise UpdateFailed(f"Error communicating with API: {err}")
+
+
+class WeatherXMForecastCoordinator(WeatherXMCoordinator):
+    """Coordinator for the 7-day forecasts, refreshed less often than devices.
+
+    Data is a dict of forecasts keyed by device id.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: WeatherXMAPI,
+        device_coordinator: WeatherXMDeviceCoordinator,
+        update_interval: timedelta,
+        concurrency: int,
+        forecast_wanted: Callable[[Device], bool] = lambda device: True,
+    ) -> None:
+        """Initialize."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="weatherxm_forecast",
+            update_interval=update_interval,
+            config_entry=None,
+        )
+        self.api = api
+        self.device_coordinator = device_coordinator
+        self._forecast_wanted = forecast_wanted
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._concurrency = concurrency
+
+    @property
+    def concurrency(self) -> int:
+        """Return how many forecasts are downloaded at the same time."""
+        return self._concurrency
+
+    @concurrency.setter
+    def concurrency(self, value: int) -> None:
+        """Change the parallelism; downloads in flight finish under the previous limit."""
+        if value != self._concurrency:
+            self._concurrency = value
+            self._semaphore = asyncio.Semaphore(value)
+
+    async def _async_fetch_device(self, device_id: str) -> Forecast:
+        """Fetch the forecast of a single device, bounded by the semaphore."""
+        async with self._semaphore:
+            _LOGGER.debug("Fetching forecast for device %s", device_id)
+            return await self.api.get_forecast_data(device_id)
+
+    async def _async_fetch_data(self) -> dict[str, Forecast]:
+        """Fetch forecasts for the devices whose forecast is consumed."""
+        device_ids = [
+            device.id for device in (self.device_coordinator.data or {}).values()
+            if self._forecast_wanted(device)
+        ]
+        previous = self.data or {}
+
+        _LOGGER.debug("Starting WeatherXM forecast update for %s devices", len(device_ids))
+        results = await asyncio.gather(
+            *(self._async_fetch_device(device_id) for device_id in device_ids),
+            return_exceptions=True,
+        )
+
+        forecasts = {}
+        failed = []
+        for device_id, forecast in zip(device_ids, results):
+            if isinstance(forecast, Exception):
+                # Keep the last known forecast so a single failing device
+                # does not fail the whole refresh.
+                _LOGGER.warning("Failed to fetch forecast for device %s: %s", device_id, forecast)
+                forecast = previous.get(device_id, Forecast())
+                failed.append(device_id)
+            forecasts[device_id] = forecast
+        self._record_failures(failed)
+
+        if device_ids and all(isinstance(result, Exception) for result in results):
+            raise UpdateFailed("Error fetching forecasts for all devices")
+
+        _LOGGER.debug("WeatherXM forecast update completed successfully")
+        return forecasts
@@ -0,0 +1,88 @@
+"""Diagnostic sensors reporting API and refresh timings of an account."""
+
+from __future__ import annotations
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import WeatherXMDeviceCoordinator
+from .weatherxm_api import WeatherXMAPI
+
+
+class WeatherXMDiagnosticSensor(CoordinatorEntity[WeatherXMDeviceCoordinator], SensorEntity):
+    """Account-wide diagnostic sensor, updated after every device refresh.
+
+    Disabled by default; enable it to follow the metrics over time.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator: WeatherXMDeviceCoordinator, api: WeatherXMAPI, entry_id: str, key: str, name: str) -> None:
+        """Initialize."""
+        super().__init__(coordinator)
+        self._api = api
+        self._entry_id = entry_id
+        self._attr_name = f"WeatherXM {name}"
+        self._attr_unique_id = f"{entry_id}_{key}"
+
+    @property
+    def available(self) -> bool:
+        """Return True, the metrics are meaningful even when a refresh failed."""
+        return True
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the account as a service device."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._entry_id)},
+            name="WeatherXM Account",
+            manufacturer="WeatherXM",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+
+class WeatherXMApiLatencySensor(WeatherXMDiagnosticSensor):
+    """Mean latency of all API requests."""
+
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 0
+
+    def __init__(self, coordinator, api, entry_id):
+        super().__init__(coordinator, api, entry_id, "api_latency", "API latency")
+
+    @property
+    def native_value(self):
+        return round(self._api.metrics.mean_latency * 1000, 1)
+
+
+class WeatherXMApiRequestsSensor(WeatherXMDiagnosticSensor):
+    """Number of API requests sent since startup."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, coordinator, api, entry_id):
+        super().__init__(coordinator, api, entry_id, "api_requests", "API requests")
+
+    @property
+    def native_value(self):
+        return self._api.metrics.requests
+
+
+class WeatherXMRefreshDurationSensor(WeatherXMDiagnosticSensor):
+    """Duration of the last device refresh."""
+
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 0
+
+    def __init__(self, coordinator, api, entry_id):
+        super().__init__(coordinator, api, entry_id, "refresh_duration", "Refresh duration")
+
+    @property
+    def native_value(self):
+        return round(self.coordinator.refresh_stats.last * 1000, 1)
@@ -0,0 +1,60 @@
+"""Diagnostics support for the WeatherXM integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import WeatherXMCoordinator
+
+TO_REDACT = {
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    "token",
+    "refreshToken",
+    "address",
+    "lat",
+    "lon",
+}
+
+
+def _coordinator_diagnostics(coordinator: WeatherXMCoordinator) -> dict[str, Any]:
+    """Return the state and timings of a coordinator."""
+    return {
+        "last_update_success": coordinator.last_update_success,
+        "update_interval": str(coordinator.update_interval),
+        "devices": len(coordinator.data or {}),
+        "refresh": coordinator.refresh_stats.as_dict(),
+        "state_writes": {
+            module: stats.as_dict() for module, stats in coordinator.state_write_stats.items()
+        },
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = data['coordinator']
+    forecast_coordinator = data['forecast_coordinator']
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "coordinators": {
+            "devices": _coordinator_diagnostics(coordinator),
+            "forecasts": _coordinator_diagnostics(forecast_coordinator),
+        },
+        "api": {
+            "token_valid": data['api'].token_valid,
+            "endpoints": data['api'].metrics.as_dict(),
+        },
+        "devices": async_redact_data(
+            [device.to_dict() for device in (coordinator.data or {}).values()], TO_REDACT
+        ),
+    }
@@ -0,0 +1,69 @@
+"""Base entity for the WeatherXM integration."""
+
+from __future__ import annotations
+
+import time
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import WeatherXMCoordinator
+from .metrics import TimingStats
+
+
+class WeatherXMEntity(CoordinatorEntity[WeatherXMCoordinator]):
+    """Entity bound to a single WeatherXM device.
+
+    State is only written when the device's slice of the coordinator data
+    changed or the entity availability flipped. Writes are timed into the
+    coordinator's state_write_stats.
+    """
+
+    def __init__(self, coordinator: WeatherXMCoordinator, device_id: str, alias: str) -> None:
+        """Initialize."""
+        super().__init__(coordinator)
+        self._device_id = device_id
+        self._alias = alias
+        self._last_available: bool | None = None
+
+    def _get_device_data(self):
+        """Get device data from coordinator."""
+        if not self.coordinator.data:
+            return None
+        return self.coordinator.data.get(self._device_id)
+
+    @property
+    def available(self) -> bool:
+        """Return False if the last refresh failed or the device keeps failing."""
+        return super().available and self.coordinator.device_available(self._device_id)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if the device data or availability changed."""
+        available = self.available
+        if self._device_id in self.coordinator.changed_device_ids or available != self._last_available:
+            self._last_available = available
+            self._async_write_state_timed()
+
+    @callback
+    def _async_write_state_timed(self) -> None:
+        """Write the state, recording how long it took for this platform module."""
+        start = time.perf_counter()
+        self.async_write_ha_state()
+        module = type(self).__module__.rpartition('.')[2]
+        stats = self.coordinator.state_write_stats.get(module)
+        if stats is None:
+            stats = self.coordinator.state_write_stats[module] = TimingStats()
+        stats.record(time.perf_counter() - start)
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device information."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._device_id)},
+            name=self._alias,
+            manufacturer="WeatherXM",
+            model="Weather Station",
+        )
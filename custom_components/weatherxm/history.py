@@ -0,0 +1,221 @@
+"""Backfill of station observations into long-term statistics."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Callable, Iterable
+from datetime import date, datetime, timedelta, timezone
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import HISTORY_DAYS, HISTORY_PAGE_DAYS, HISTORY_UPDATE_INTERVAL
+from .statistics import WEATHER_SERIES, async_import_hourly
+from .weatherxm_api import CurrentWeather, Device, WeatherXMAPI
+
+_LOGGER = logging.getLogger(__name__)
+
+HISTORY_SERIES = WEATHER_SERIES
+HISTORY_COLUMNS = tuple(series.key for series in HISTORY_SERIES)
+
+
+class HistoryCache:
+    """SQLite cache of observations keyed by device and timestamp.
+
+    Days whose observations were fully downloaded are recorded, so only
+    missing days are requested again. Methods block and must run in the
+    executor.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._closed = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating the tables if needed."""
+        if self._closed:
+            raise RuntimeError("History cache is closed")
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            columns = ", ".join(f"{column} REAL" for column in HISTORY_COLUMNS)
+            self._connection.executescript(f"""
+                CREATE TABLE IF NOT EXISTS observations (
+                    device_id TEXT NOT NULL,
+                    timestamp INTEGER NOT NULL,
+                    {columns},
+                    PRIMARY KEY (device_id, timestamp)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS complete_days (
+                    device_id TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    PRIMARY KEY (device_id, day)
+                ) WITHOUT ROWID;
+            """)
+        return self._connection
+
+    def missing_days(self, device_id: str, days: Iterable[date]) -> list[date]:
+        """Return the days that were not fully downloaded yet."""
+        with self._lock:
+            complete = {
+                row[0] for row in self._connect().execute(
+                    "SELECT day FROM complete_days WHERE device_id = ?", (device_id,)
+                )
+            }
+        return [day for day in days if day.isoformat() not in complete]
+
+    def store(self, device_id: str, observations: list[CurrentWeather], complete_days: list[date]) -> None:
+        """Store observations and mark days as fully downloaded."""
+        placeholders = ", ".join("?" for _ in HISTORY_COLUMNS)
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    f"INSERT OR REPLACE INTO observations (device_id, timestamp, {', '.join(HISTORY_COLUMNS)}) "
+                    f"VALUES (?, ?, {placeholders})",
+                    [
+                        (
+                            device_id,
+                            int(datetime.fromisoformat(observation.timestamp).timestamp()),
+                            *(getattr(observation, column) for column in HISTORY_COLUMNS),
+                        )
+                        for observation in observations
+                    ],
+                )
+                connection.executemany(
+                    "INSERT OR IGNORE INTO complete_days (device_id, day) VALUES (?, ?)",
+                    [(device_id, day.isoformat()) for day in complete_days],
+                )
+
+    def samples(self, device_id: str, column: str, since: float) -> list[tuple[int, float]]:
+        """Return the (timestamp, value) samples of a column newer than since."""
+        if column not in HISTORY_COLUMNS:
+            raise ValueError(f"Unknown history column {column}")
+        with self._lock:
+            return self._connect().execute(
+                f"SELECT timestamp, {column} FROM observations "
+                "WHERE device_id = ? AND timestamp >= ? ORDER BY timestamp",
+                (device_id, int(since)),
+            ).fetchall()
+
+    def close(self) -> None:
+        """Close the database; it is not reopened afterwards."""
+        with self._lock:
+            self._closed = True
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def _pages(days: list[date]) -> list[tuple[date, date]]:
+    """Split days into contiguous (from, to) ranges of at most HISTORY_PAGE_DAYS."""
+    pages: list[tuple[date, date]] = []
+    for day in sorted(days):
+        if pages:
+            start, end = pages[-1]
+            if day == end + timedelta(days=1) and (day - start).days < HISTORY_PAGE_DAYS:
+                pages[-1] = (start, day)
+                continue
+        pages.append((day, day))
+    return pages
+
+
+def history_path(hass: HomeAssistant, storage_key: str) -> str:
+    """Return the path of the history database of an account."""
+    return hass.config.path(STORAGE_DIR, f"{storage_key}.history.db")
+
+
+class WeatherXMHistory:
+    """Download missing observations and import them as statistics."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: WeatherXMAPI,
+        storage_key: str,
+        devices: Callable[[], Iterable[Device]],
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.api = api
+        self._devices = devices
+        self._cache = HistoryCache(history_path(hass, storage_key))
+        self._unsubscribe: CALLBACK_TYPE | None = None
+        self._task: asyncio.Task | None = None
+
+    def async_start(self) -> None:
+        """Backfill now and then periodically."""
+        self._async_schedule_backfill()
+        self._unsubscribe = async_track_time_interval(
+            self.hass,
+            self._async_schedule_backfill,
+            timedelta(minutes=HISTORY_UPDATE_INTERVAL),
+        )
+
+    @callback
+    def _async_schedule_backfill(self, _now: datetime | None = None) -> None:
+        """Start a backfill unless one is still running."""
+        if self._task is None or self._task.done():
+            self._task = self.hass.async_create_background_task(
+                self.async_backfill(), "weatherxm_history_backfill"
+            )
+
+    async def async_stop(self) -> None:
+        """Stop the periodic backfill, wait for a running one to end and close the cache."""
+        if self._unsubscribe:
+            self._unsubscribe()
+            self._unsubscribe = None
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+        await self.hass.async_add_executor_job(self._cache.close)
+
+    async def async_backfill(self) -> None:
+        """Backfill every device, isolating failures per device."""
+        for device in list(self._devices()):
+            try:
+                await self._async_backfill_device(device)
+            except Exception as err:  # a bad device must not stop the others
+                _LOGGER.warning("Failed to backfill history for device %s: %r", device.id, err)
+
+    async def _async_backfill_device(self, device: Device) -> None:
+        """Download the missing days of a device and import the new hours."""
+        today = datetime.now(timezone.utc).date()
+        days = [today - timedelta(days=offset) for offset in range(HISTORY_DAYS, -1, -1)]
+        missing = await self.hass.async_add_executor_job(self._cache.missing_days, device.id, days)
+
+        for start, end in _pages(missing):
+            _LOGGER.debug("Fetching history of device %s from %s to %s", device.id, start, end)
+            observations = await self.api.get_history(device.id, start, end)
+            # Recent days may still receive data; only older ones are final
+            complete = [
+                start + timedelta(days=offset)
+                for offset in range((end - start).days + 1)
+                if start + timedelta(days=offset) < today - timedelta(days=1)
+            ]
+            await self.hass.async_add_executor_job(self._cache.store, device.id, observations, complete)
+
+        since = (datetime.now(timezone.utc) - timedelta(days=HISTORY_DAYS + 1)).timestamp()
+        for series in HISTORY_SERIES:
+            samples = await self.hass.async_add_executor_job(
+                self._cache.samples, device.id, series.key, since
+            )
+            imported = await async_import_hourly(self.hass, device.id, device.alias, series, samples)
+            _LOGGER.debug("Imported %s hours of %s for device %s", imported, series.key, device.id)
+
+
+async def async_remove_history(hass: HomeAssistant, storage_key: str) -> None:
+    """Delete the history database of an account."""
+    path = history_path(hass, storage_key)
+    if await hass.async_add_executor_job(os.path.exists, path):
+        await hass.async_add_executor_job(os.remove, path)
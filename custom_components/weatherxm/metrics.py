@@ -0,0 +1,131 @@
+"""Lightweight runtime metrics of the WeatherXM integration.
+
+Collected unconditionally at the cost of a few counters per request, refresh
+and state write, and exposed through diagnostics and diagnostic sensors.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+@dataclass(slots=True)
+class TimingStats:
+    """Count, total, last and maximum of a series of durations, in seconds."""
+
+    count: int = 0
+    total: float = 0.0
+    last: float = 0.0
+    maximum: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one duration."""
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        self.maximum = max(self.maximum, seconds)
+
+    @property
+    def mean(self) -> float:
+        """Return the mean duration, 0 if nothing was recorded."""
+        return self.total / self.count if self.count else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats in milliseconds."""
+        return {
+            'count': self.count,
+            'mean_ms': round(self.mean * 1000, 3),
+            'last_ms': round(self.last * 1000, 3),
+            'max_ms': round(self.maximum * 1000, 3),
+        }
+
+
+@dataclass(slots=True)
+class LatencyHistogram:
+    """Request latencies counted in LATENCY_BUCKETS_MS buckets."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    timing: TimingStats = field(default_factory=TimingStats)
+
+    def record(self, seconds: float) -> None:
+        """Add one latency."""
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)] += 1
+        self.timing.record(seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the bucket counts keyed by their upper bound."""
+        buckets = {f'le_{bound}ms': count for bound, count in zip(LATENCY_BUCKETS_MS, self.counts)}
+        buckets['inf'] = self.counts[-1]
+        return {**self.timing.as_dict(), 'buckets': buckets}
+
+
+@dataclass(slots=True)
+class EndpointMetrics:
+    """Counters of one API endpoint."""
+
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    not_modified: int = 0
+    bytes: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    decode: TimingStats = field(default_factory=TimingStats)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters as plain data."""
+        return {
+            'requests': self.requests,
+            'retries': self.retries,
+            'errors': self.errors,
+            'cache_hits': self.cache_hits,
+            'not_modified': self.not_modified,
+            'bytes': self.bytes,
+            'latency': self.latency.as_dict(),
+            'decode': self.decode.as_dict(),
+        }
+
+
+def endpoint_name(endpoint: str) -> str:
+    """Return the endpoint with device ids replaced, so devices share one entry."""
+    parts = endpoint.split('/')
+    if parts[:2] == ['me', 'devices'] and len(parts) > 2:
+        parts[2] = '{device_id}'
+    return '/'.join(parts)
+
+
+class ApiMetrics:
+    """Per-endpoint metrics of an API client."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.endpoints: dict[str, EndpointMetrics] = {}
+
+    def endpoint(self, endpoint: str) -> EndpointMetrics:
+        """Return the metrics of an endpoint, creating them if needed."""
+        name = endpoint_name(endpoint)
+        metrics = self.endpoints.get(name)
+        if metrics is None:
+            metrics = self.endpoints[name] = EndpointMetrics()
+        return metrics
+
+    @property
+    def requests(self) -> int:
+        """Return the number of requests sent to any endpoint."""
+        return sum(metrics.requests for metrics in self.endpoints.values())
+
+    @property
+    def mean_latency(self) -> float:
+        """Return the mean latency over all endpoints, in seconds."""
+        count = sum(metrics.latency.timing.count for metrics in self.endpoints.values())
+        total = sum(metrics.latency.timing.total for metrics in self.endpoints.values())
+        return total / count if count else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics of every endpoint as plain data."""
+        return {name: metrics.as_dict() for name, metrics in self.endpoints.items()}
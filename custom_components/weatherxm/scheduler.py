@@ -0,0 +1,105 @@
+"""Adaptive polling based on when stations actually report."""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import timedelta
+
+from .const import (
+    DEVICES_UPDATE_INTERVAL,
+    INACTIVE_DEVICES_UPDATE_INTERVAL,
+    MAX_DEVICES_UPDATE_INTERVAL,
+    MIN_DEVICES_UPDATE_INTERVAL,
+)
+from .utils import report_time
+from .weatherxm_api import Device
+
+# Weight of the newest interval in the cadence moving average
+CADENCE_SMOOTHING = 0.3
+# Delay after the expected report before polling, so the report is available
+REPORT_GRACE = 30
+# A station silent for this many cadences is considered stalled and ignored
+STALLED_CADENCES = 3
+
+
+@dataclass(slots=True)
+class _StationCadence:
+    """Last report time and estimated reporting cadence of a station."""
+
+    last_report: float
+    cadence: float | None = None
+
+    def observe(self, report: float) -> None:
+        """Update the cadence with a new report time."""
+        if report <= self.last_report:
+            return
+        interval = report - self.last_report
+        if self.cadence is None:
+            self.cadence = interval
+        else:
+            self.cadence = CADENCE_SMOOTHING * interval + (1 - CADENCE_SMOOTHING) * self.cadence
+        self.last_report = report
+
+    def next_report(self, now: float) -> float | None:
+        """Return when the next report is expected, or None if unknown or stalled."""
+        if not self.cadence:
+            return None
+        missed = math.floor((now - self.last_report) / self.cadence)
+        if missed >= STALLED_CADENCES:
+            return None
+        return self.last_report + (max(missed, 0) + 1) * self.cadence
+
+
+class AdaptivePollScheduler:
+    """Learn each station's reporting cadence and pick the next poll interval.
+
+    The next poll is scheduled just after the earliest expected report of an
+    active station, clamped between the minimum and maximum intervals.
+    Inactive and stalled stations are ignored; if nothing is expected to
+    report, polling backs off.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._stations: dict[str, _StationCadence] = {}
+
+    def next_interval(self, devices: Iterable[Device]) -> timedelta:
+        """Record the latest reports and return the delay until the next poll."""
+        now = time.time()
+        seen = set()
+        expected = []
+        any_active = False
+
+        for device in devices:
+            seen.add(device.id)
+            report = report_time(device)
+            if report is None:
+                continue
+            station = self._stations.get(device.id)
+            if station is None:
+                station = self._stations[device.id] = _StationCadence(last_report=report)
+            else:
+                station.observe(report)
+            if not device.is_active:
+                continue
+            any_active = True
+            next_report = station.next_report(now)
+            if next_report is not None:
+                expected.append(next_report)
+
+        for device_id in self._stations.keys() - seen:
+            del self._stations[device_id]
+
+        if not any_active:
+            return timedelta(minutes=INACTIVE_DEVICES_UPDATE_INTERVAL)
+        if not expected:
+            return timedelta(minutes=DEVICES_UPDATE_INTERVAL)
+
+        delay = min(expected) + REPORT_GRACE - now
+        return timedelta(seconds=min(
+            max(delay, MIN_DEVICES_UPDATE_INTERVAL * 60),
+            MAX_DEVICES_UPDATE_INTERVAL * 60,
+        ))
@@ -1,58 +1,69 @@
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
-from .utils import async_setup_entities_list
+from .const import DOMAIN, CONF_STATISTICS_IMPORT
+from .utils import async_add_device_entities
 from .battery import WeatherXMBatteryLevelSensor
 from .rewards import WeatherXMRewardsSensor, WeatherXMTotalRewardsSensor
 from .firmware import WeatherXMFirmwareSensor
 from .last_update import WeatherXMLastUpdateSensor
+from .diagnostic_sensors import (
+    WeatherXMApiLatencySensor,
+    WeatherXMApiRequestsSensor,
+    WeatherXMRefreshDurationSensor,
+)
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]['coordinator']
+    external_statistics = entry.options.get(CONF_STATISTICS_IMPORT, False)
 
     # Battery indicators
-    batteries = await async_setup_entities_list(hass, entry, lambda alias, device: WeatherXMBatteryLevelSensor(
+    async_add_device_entities(hass, entry, async_add_entities, lambda alias, device: WeatherXMBatteryLevelSensor(
         coordinator=coordinator,
-        device_id=device['id'],
+        device_id=device.id,
         alias=alias,
-        bat_state=device['bat_state'],
-        is_active=device['attributes'].get('isActive', False)
+        bat_state=device.bat_state,
+        is_active=device.is_active
     ))
-    async_add_entities(batteries, True)
 
     # Rewards sensors
-    rewards = await async_setup_entities_list(hass, entry, lambda alias, device: WeatherXMRewardsSensor(
+    async_add_device_entities(hass, entry, async_add_entities, lambda alias, device: WeatherXMRewardsSensor(
         coordinator=coordinator,
-        device_id=device['id'],
+        device_id=device.id,
         alias=alias,
-        actual_reward=device['rewards']['actual_reward'],
-        total_rewards=device['rewards']['total_rewards']
+        actual_reward=device.rewards.actual_reward,
+        total_rewards=device.rewards.total_rewards,
+        external_statistics=external_statistics
     ))
-    async_add_entities(rewards, True)
 
     # Total rewards sensors
-    trewards = await async_setup_entities_list(hass, entry, lambda alias, device: WeatherXMTotalRewardsSensor(
+    async_add_device_entities(hass, entry, async_add_entities, lambda alias, device: WeatherXMTotalRewardsSensor(
         coordinator=coordinator,
-        device_id=device['id'],
+        device_id=device.id,
         alias=alias,
-        total_rewards=device['rewards']['total_rewards']
+        total_rewards=device.rewards.total_rewards,
+        external_statistics=external_statistics
     ))
-    async_add_entities(trewards, True)
 
     # Firmware sensors
-    firmware = await async_setup_entities_list(hass, entry, lambda alias, device: WeatherXMFirmwareSensor(
+    async_add_device_entities(hass, entry, async_add_entities, lambda alias, device: WeatherXMFirmwareSensor(
         coordinator=coordinator,
-        device_id=device['id'],
+        device_id=device.id,
         alias=alias,
-        firmware=device['attributes']['firmware']
+        firmware=device.firmware
     ))
-    async_add_entities(firmware, True)
 
     # Last update sensors
-    last_update = await async_setup_entities_list(hass, entry, lambda alias, device: WeatherXMLastUpdateSensor(
+    async_add_device_entities(hass, entry, async_add_entities, lambda alias, device: WeatherXMLastUpdateSensor(
         coordinator=coordinator,
-        device_id=device['id'],
+        device_id=device.id,
         alias=alias
     ))
-    async_add_entities(last_update, True)
+
+    # Account diagnostics, disabled by default
+    api = hass.data[DOMAIN][entry.entry_id]['api']
+    async_add_entities([
+        WeatherXMApiLatencySensor(coordinator, api, entry.entry_id),
+        WeatherXMApiRequestsSensor(coordinator, api, entry.entry_id),
+        WeatherXMRefreshDurationSensor(coordinator, api, entry.entry_id),
+    ])
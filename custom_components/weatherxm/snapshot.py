@@ -0,0 +1,114 @@
+"""Persisted snapshot of the last coordinator data for instant startup."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import SNAPSHOT_SAVE_DELAY, SNAPSHOT_STORAGE_VERSION
+from .coordinator import WeatherXMDeviceCoordinator, WeatherXMForecastCoordinator
+from .weatherxm_api import Device, Forecast
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _SnapshotStore(Store):
+    """Store that migrates snapshots written by older versions."""
+
+    async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
+        """Keep the devices of an older snapshot and drop its forecasts, stored in an older layout."""
+        return {'devices': old_data.get('devices', {})}
+
+
+class WeatherXMSnapshot:
+    """Last successful devices and forecasts of an account."""
+
+    def __init__(self, hass: HomeAssistant, storage_key: str) -> None:
+        """Initialize."""
+        self._store = _SnapshotStore(hass, SNAPSHOT_STORAGE_VERSION, f"{storage_key}.snapshot")
+        self._devices: dict[str, dict[str, Any]] = {}
+        self._forecasts: dict[str, dict[str, Any]] = {}
+        self._forecasts_updated: float = 0
+
+    @property
+    def forecasts_age(self) -> float:
+        """Return the age of the stored forecasts in seconds."""
+        return time.time() - self._forecasts_updated
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Load the snapshot as parsed devices and forecasts.
+
+        Returns None if there is none or it cannot be parsed, so setup falls
+        back to a live refresh.
+        """
+        data = await self._store.async_load()
+        if not data or not data.get('devices'):
+            return None
+        try:
+            restored = {
+                'devices': {
+                    device_id: Device.from_dict(device) for device_id, device in data['devices'].items()
+                },
+                'forecasts': {
+                    device_id: Forecast.from_dict(forecast)
+                    for device_id, forecast in data.get('forecasts', {}).items()
+                },
+            }
+        except (AttributeError, KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Discarding unreadable WeatherXM snapshot: %r", err)
+            return None
+        self._devices = data['devices']
+        self._forecasts = data.get('forecasts', {})
+        self._forecasts_updated = data.get('forecasts_updated', 0)
+        return restored
+
+    async def async_remove(self) -> None:
+        """Delete the snapshot from disk."""
+        await self._store.async_remove()
+
+    @callback
+    def async_track(
+        self,
+        coordinator: WeatherXMDeviceCoordinator,
+        forecast_coordinator: WeatherXMForecastCoordinator,
+    ) -> CALLBACK_TYPE:
+        """Save the snapshot after every successful refresh of either coordinator."""
+
+        @callback
+        def _async_devices_updated() -> None:
+            if coordinator.last_update_success and coordinator.data:
+                self._devices = {
+                    device_id: device.to_dict() for device_id, device in coordinator.data.items()
+                }
+                self._store.async_delay_save(self._data, SNAPSHOT_SAVE_DELAY)
+
+        @callback
+        def _async_forecasts_updated() -> None:
+            if forecast_coordinator.last_update_success and forecast_coordinator.data:
+                self._forecasts = {
+                    device_id: forecast.to_dict() for device_id, forecast in forecast_coordinator.data.items()
+                }
+                self._forecasts_updated = time.time()
+                self._store.async_delay_save(self._data, SNAPSHOT_SAVE_DELAY)
+
+        remove_devices = coordinator.async_add_listener(_async_devices_updated)
+        remove_forecasts = forecast_coordinator.async_add_listener(_async_forecasts_updated)
+
+        @callback
+        def _async_remove() -> None:
+            remove_devices()
+            remove_forecasts()
+
+        return _async_remove
+
+    def _data(self) -> dict[str, Any]:
+        """Return the data to write to disk."""
+        return {
+            'devices': self._devices,
+            'forecasts': self._forecasts,
+            'forecasts_updated': self._forecasts_updated,
+        }
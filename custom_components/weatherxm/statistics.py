@@ -0,0 +1,226 @@
+"""Import of WeatherXM data as Home Assistant external statistics."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from homeassistant.const import (
+    PERCENTAGE,
+    UnitOfPrecipitationDepth,
+    UnitOfPressure,
+    UnitOfSpeed,
+    UnitOfTemperature,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.util import slugify
+
+from .const import DOMAIN
+from .coordinator import WeatherXMDeviceCoordinator
+from .utils import report_time
+from .weatherxm_api import Device
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class StatisticSeries:
+    """A value imported as one hourly statistic per device.
+
+    Plain series get an hourly mean, min and max. has_sum series treat the
+    hourly mean as the amount of that hour and keep a running sum, and
+    cumulative series already are a running total reported by the API.
+    """
+
+    key: str
+    name: str
+    unit: str | None
+    has_sum: bool = False
+    cumulative: bool = False
+
+    @property
+    def sums(self) -> bool:
+        """Return True if the statistic has a sum rather than a mean."""
+        return self.has_sum or self.cumulative
+
+
+WEATHER_SERIES = (
+    StatisticSeries("temperature", "Temperature", UnitOfTemperature.CELSIUS),
+    StatisticSeries("humidity", "Humidity", PERCENTAGE),
+    StatisticSeries("pressure", "Pressure", UnitOfPressure.HPA),
+    StatisticSeries("wind_speed", "Wind speed", UnitOfSpeed.METERS_PER_SECOND),
+    StatisticSeries("precipitation", "Precipitation", UnitOfPrecipitationDepth.MILLIMETERS, has_sum=True),
+)
+REWARD_SERIES = (
+    StatisticSeries("actual_reward", "Rewards", "WXM"),
+    StatisticSeries("total_rewards", "Total rewards", "WXM", cumulative=True),
+)
+
+
+# Statistics written from live refreshes, kept apart from the imported history
+LIVE_SOURCE = "live"
+
+
+def statistic_id(device_id: str, series: StatisticSeries, source: str | None = None) -> str:
+    """Return the external statistic id of a series for a device.
+
+    Each writer passes its own source so their hourly rows never overwrite
+    each other; the history import uses none.
+    """
+    if source:
+        return f"{DOMAIN}:{slugify(device_id)}_{source}_{series.key}"
+    return f"{DOMAIN}:{slugify(device_id)}_{series.key}"
+
+
+def hourly_aggregates(samples: Iterable[tuple[float, float]]) -> dict[int, tuple[float, float, float, float]]:
+    """Group (timestamp, value) samples by hour into (mean, min, max, last)."""
+    buckets: dict[int, list[float]] = {}
+    for timestamp, value in samples:
+        if value is None:
+            continue
+        buckets.setdefault(int(timestamp // 3600 * 3600), []).append(value)
+    return {
+        hour: (sum(values) / len(values), min(values), max(values), values[-1])
+        for hour, values in sorted(buckets.items())
+    }
+
+
+async def async_last_statistic(hass: HomeAssistant, stat_id: str) -> tuple[float, float] | None:
+    """Return the start and sum of the last imported hour of a statistic."""
+    from homeassistant.components.recorder import get_instance
+    from homeassistant.components.recorder.statistics import get_last_statistics
+
+    last = await get_instance(hass).async_add_executor_job(
+        get_last_statistics, hass, 1, stat_id, True, {"sum"}
+    )
+    if not last.get(stat_id):
+        return None
+    row = last[stat_id][0]
+    start = row["start"]
+    if isinstance(start, datetime):
+        start = start.timestamp()
+    return start, row.get("sum") or 0.0
+
+
+async def async_import_hourly(
+    hass: HomeAssistant,
+    device_id: str,
+    device_name: str,
+    series: StatisticSeries,
+    samples: Iterable[tuple[float, float]],
+    source: str | None = None,
+) -> int:
+    """Import the complete hours of samples newer than the last imported hour.
+
+    Returns the number of hours imported.
+    """
+    from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+    from homeassistant.components.recorder.statistics import async_add_external_statistics
+
+    stat_id = statistic_id(device_id, series, source)
+    last = await async_last_statistic(hass, stat_id)
+    last_start, total = last if last else (None, 0.0)
+    current_hour = time.time() // 3600 * 3600
+
+    rows = []
+    for hour, (mean, minimum, maximum, last_value) in hourly_aggregates(samples).items():
+        if hour >= current_hour or (last_start is not None and hour <= last_start):
+            continue
+        start = datetime.fromtimestamp(hour, timezone.utc)
+        if series.cumulative:
+            rows.append(StatisticData(start=start, state=last_value, sum=last_value))
+        elif series.has_sum:
+            total += mean
+            rows.append(StatisticData(start=start, state=mean, sum=total))
+        else:
+            rows.append(StatisticData(start=start, mean=mean, min=minimum, max=maximum))
+
+    if rows:
+        async_add_external_statistics(hass, StatisticMetaData(
+            has_mean=not series.sums,
+            has_sum=series.sums,
+            name=f"{device_name} {series.name}" + (f" ({source})" if source else ""),
+            source=DOMAIN,
+            statistic_id=stat_id,
+            unit_of_measurement=series.unit,
+        ), rows)
+    return len(rows)
+
+
+class WeatherXMStatistics:
+    """Buffer device values and write them as hourly statistics in batches.
+
+    Samples are collected on every device refresh and written once per hour,
+    one batch per device and series, under LIVE_SOURCE statistic ids. Entity
+    states are still recorded as usual; only the statistics the recorder
+    would compile from the rewards sensors are replaced.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: WeatherXMDeviceCoordinator,
+        devices: Callable[[], Iterable[Device]],
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self._devices = devices
+        self._names: dict[str, str] = {}
+        self._samples: dict[tuple[str, StatisticSeries], dict[float, float]] = {}
+        self._unsubscribe: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Collect samples on refresh and write them every hour."""
+        self._unsubscribe.append(self.coordinator.async_add_listener(self._async_collect))
+        self._unsubscribe.append(async_track_time_change(
+            self.hass, self._async_flush_at, minute=1, second=0
+        ))
+
+    async def _async_flush_at(self, _now: datetime) -> None:
+        """Write the buffered complete hours, on the event loop."""
+        await self.async_flush()
+
+    async def async_stop(self) -> None:
+        """Stop collecting and write the buffered complete hours."""
+        while self._unsubscribe:
+            self._unsubscribe.pop()()
+        await self.async_flush()
+
+    @callback
+    def _async_collect(self) -> None:
+        """Buffer the values of the latest refresh."""
+        if not self.coordinator.last_update_success:
+            return
+        for device in self._devices():
+            self._names[device.id] = device.alias
+            observed = report_time(device) or time.time()
+            for series in WEATHER_SERIES:
+                value = getattr(device.current_weather, series.key)
+                if value is not None:
+                    self._samples.setdefault((device.id, series), {})[observed] = value
+            now = time.time()
+            for series in REWARD_SERIES:
+                value = getattr(device.rewards, series.key)
+                if value is not None:
+                    self._samples.setdefault((device.id, series), {})[now] = value
+
+    async def async_flush(self) -> None:
+        """Write the complete hours buffered so far."""
+        current_hour = time.time() // 3600 * 3600
+        for (device_id, series), samples in list(self._samples.items()):
+            try:
+                await async_import_hourly(
+                    self.hass, device_id, self._names.get(device_id, device_id), series, samples.items(),
+                    LIVE_SOURCE,
+                )
+            except Exception as err:  # recorder errors must not stop the other series
+                _LOGGER.warning("Failed to write %s statistics for device %s: %s", series.key, device_id, err)
+                continue
+            for observed in [observed for observed in samples if observed < current_hour]:
+                del samples[observed]
@@ -1,25 +1,85 @@
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from datetime import datetime
 from typing import Callable, Any
 from .const import DOMAIN, CONF_FILTER_OWNED_DEVICES
+from .weatherxm_api import Device
 
-async def async_setup_entities_list(
+
+def report_time(device: Device) -> float | None:
+    """Return the time of the latest report of a device as UNIX seconds, if known."""
+    timestamp = device.current_weather.timestamp or device.last_activity
+    if not timestamp:
+        return None
+    try:
+        return datetime.fromisoformat(timestamp).timestamp()
+    except ValueError:
+        return None
+
+
+def device_included(entry: ConfigEntry, device: Device) -> bool:
+    """Return True if the entry creates entities for the device."""
+    filter_owned_devices = entry.options.get(CONF_FILTER_OWNED_DEVICES, True)
+    return not filter_owned_devices or device.relation == 'owned'
+
+
+def forecast_wanted(entry: ConfigEntry, device: Device) -> bool:
+    """Return True if some entity of the entry will consume the device's forecast."""
+    return (
+        device_included(entry, device)
+        and device.is_active
+        and device.location.lat is not None
+        and device.location.lon is not None
+    )
+
+
+@callback
+def async_add_device_entities(
     hass: HomeAssistant,
     entry: ConfigEntry,
-    entity_initializer: Callable[[str, dict[str, Any]], Any]
-) -> list:
-    """Set up entities list."""
+    async_add_entities: Callable[..., None],
+    entity_initializer: Callable[[str, Device], Any]
+) -> None:
+    """Add entities for the included devices, now and whenever new devices appear."""
     coordinator = hass.data[DOMAIN][entry.entry_id]['coordinator']
-    filter_owned_devices = entry.options.get(CONF_FILTER_OWNED_DEVICES, True)
+    known: set[str] = set()
+
+    @callback
+    def async_add_new_devices() -> None:
+        # Forget removed devices so they get entities again if they come back
+        known.intersection_update((coordinator.data or {}).keys())
+        entities = []
+        for device_id in (coordinator.data or {}).keys() - known:
+            device = coordinator.data[device_id]
+            if not device_included(entry, device):
+                continue
+            known.add(device_id)
+            entities.append(entity_initializer(device.alias, device))
+        if entities:
+            # Coordinator data is already loaded, no update needed before adding
+            async_add_entities(entities)
 
-    devices = coordinator.data
-    entities = []
+    async_add_new_devices()
+    entry.async_on_unload(coordinator.async_add_listener(async_add_new_devices))
 
-    for device in devices:
-        if filter_owned_devices and not device.get('relation') == 'owned':
-            continue
 
-        alias = device['attributes'].get('friendlyName', device['name'])
-        entities.append(entity_initializer(alias, device))
+@callback
+def async_remove_stale_devices(hass: HomeAssistant, entry: ConfigEntry) -> Callable[[], None]:
+    """Remove the devices, and so their entities, that left the account from the entry.
+
+    Returns a function that stops listening.
+    """
+    coordinator = hass.data[DOMAIN][entry.entry_id]['coordinator']
+
+    @callback
+    def async_remove_devices() -> None:
+        if not coordinator.removed_device_ids:
+            return
+        registry = dr.async_get(hass)
+        for device_id in coordinator.removed_device_ids:
+            device = registry.async_get_device(identifiers={(DOMAIN, device_id)})
+            if device and entry.entry_id in device.config_entries:
+                registry.async_update_device(device.id, remove_config_entry_id=entry.entry_id)
 
-    return entities
+    return coordinator.async_add_listener(async_remove_devices)
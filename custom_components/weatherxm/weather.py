@@ -1,12 +1,12 @@
+from itertools import islice
+
 from homeassistant.components.weather import (
     WeatherEntity,
     WeatherEntityFeature,
-    Forecast,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.helpers.entity import generate_entity_id, DeviceInfo
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import generate_entity_id
 from homeassistant.const import (
     UnitOfPrecipitationDepth,
     UnitOfPressure,
@@ -14,17 +14,19 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 from .const import DOMAIN
-from .utils import async_setup_entities_list
+from .entity import WeatherXMEntity
+from .utils import async_add_device_entities
+from .weatherxm_api import CurrentWeather, Forecast
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
-    entities = await async_setup_entities_list(hass, entry, lambda alias, device: WeatherXMWeather(
+    async_add_device_entities(hass, entry, async_add_entities, lambda alias, device: WeatherXMWeather(
         coordinator=hass.data[DOMAIN][entry.entry_id]['coordinator'],
+        forecast_coordinator=hass.data[DOMAIN][entry.entry_id]['forecast_coordinator'],
         entity_id=generate_entity_id("weather.{}", alias, hass=hass),
-        device_id=device['id'],
+        device_id=device.id,
         alias=alias,
-        address=device['address']
+        address=device.address
     ))
-    async_add_entities(entities, True)
 
 ICON_TO_CONDITION_MAP = {
     "blizzard": "snowy",
@@ -85,7 +87,10 @@ ICON_TO_CONDITION_MAP = {
     "windy-variant": "windy-variant",
 }
 
-class WeatherXMWeather(CoordinatorEntity, WeatherEntity):
+HOURLY_FORECAST_LIMIT = 24
+DAILY_FORECAST_LIMIT = 7
+
+class WeatherXMWeather(WeatherXMEntity, WeatherEntity):
     """ WeatherXM Weather Entity """
 
     _attr_native_precipitation_unit = UnitOfPrecipitationDepth.MILLIMETERS
@@ -96,90 +101,109 @@ class WeatherXMWeather(CoordinatorEntity, WeatherEntity):
     )
     _attr_native_temperature_unit = UnitOfTemperature.CELSIUS
 
-    def __init__(self, coordinator, entity_id, device_id, alias, address):
+    def __init__(self, coordinator, forecast_coordinator, entity_id, device_id, alias, address):
         """Initialize."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, device_id, alias)
+        self._forecast_coordinator = forecast_coordinator
         self.entity_id = entity_id
-        self._device_id = device_id
         self._address = address
-        self._alias = alias
         self._attr_name = alias
         self._attr_unique_id = alias
+        # Converted forecasts, valid until the next coordinator update
+        self._forecast_cache = {}
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to forecast updates as well."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._forecast_coordinator.async_add_listener(self._handle_forecast_update)
+        )
+
+    @callback
+    def _handle_forecast_update(self) -> None:
+        """Invalidate cached forecasts and notify subscribers when this device's forecast changed.
+
+        The forecast is not part of the state, so no state is written.
+        """
+        if self._device_id in self._forecast_coordinator.changed_device_ids:
+            self._forecast_cache.clear()
+            self.hass.async_create_task(self.async_update_listeners(("daily", "hourly")))
+
+    def _cached_forecast(self, key, rows, limit=None):
+        """Return the converted forecast rows for key, building them once per update."""
+        if key not in self._forecast_cache:
+            self._forecast_cache[key] = list(islice(rows(), limit))
+        return self._forecast_cache[key]
 
     @property
     def _current_weather(self):
         """Get current weather from coordinator data."""
-        for device in self.coordinator.data or []:
-            if device['id'] == self._device_id:
-                return device['current_weather']
-        return {}
+        device = self._get_device_data()
+        return device.current_weather if device else CurrentWeather()
 
     @property
     def _forecast(self):
-        """Get forecast from coordinator data."""
-        for device in self.coordinator.data or []:
-            if device['id'] == self._device_id:
-                return device.get('forecast', [])
-        return []
+        """Get forecast from the forecast coordinator data."""
+        return (self._forecast_coordinator.data or {}).get(self._device_id) or Forecast()
 
     @property
     def native_apparent_temperature(self):
-        return self._current_weather.get("feels_like")
+        return self._current_weather.feels_like
 
     @property
     def condition(self):
-        icon = self._current_weather.get("icon")
+        icon = self._current_weather.icon
         if icon:
             return ICON_TO_CONDITION_MAP.get(icon, "unknown")
         return None
 
     @property
     def datetime(self):
-        return self._current_weather.get("timestamp")
+        return self._current_weather.timestamp
 
     @property
     def native_dew_point(self):
-        return self._current_weather.get("dew_point")
+        return self._current_weather.dew_point
 
     @property
     def humidity(self):
-        return self._current_weather.get("humidity")
+        return self._current_weather.humidity
 
     @property
     def native_precipitation(self):
-        return self._current_weather.get("precipitation")
+        return self._current_weather.precipitation
 
     @property
     def native_precipitation_accumulated(self):
-        return self._current_weather.get("precipitation_accumulated")
+        return self._current_weather.precipitation_accumulated
 
     @property
     def native_pressure(self):
-        return self._current_weather.get("pressure")
+        return self._current_weather.pressure
 
     @property
     def solar_irradiance(self):
-        return self._current_weather.get("solar_irradiance")
+        return self._current_weather.solar_irradiance
 
     @property
     def native_temperature(self):
-        return self._current_weather.get("temperature")
+        return self._current_weather.temperature
 
     @property
     def uv_index(self):
-        return self._current_weather.get("uv_index")
+        return self._current_weather.uv_index
 
     @property
     def wind_bearing(self):
-        return self._current_weather.get("wind_direction")
+        return self._current_weather.wind_direction
 
     @property
     def native_wind_gust_speed(self):
-        return self._current_weather.get("wind_gust")
+        return self._current_weather.wind_gust
 
     @property
     def native_wind_speed(self):
-        return self._current_weather.get("wind_speed")
+        return self._current_weather.wind_speed
 
     async def async_update(self):
         await self.coordinator.async_request_refresh()
@@ -221,68 +245,64 @@ class WeatherXMWeather(CoordinatorEntity, WeatherEntity):
     @property
     def forecast(self):
         return {
-            "hourly": self.forecast_hourly[:24],  # Limit to 24 hourly forecasts
-            "daily": self.forecast_daily[:7],  # Limit to 7 daily forecasts
+            "hourly": self._hourly_window(),
+            "daily": self._daily_window(),
         }
 
     @property
     def forecast_hourly(self):
-        forecasts = []
-        for daily in self._forecast:
-            for hourly in daily.get("hourly", []):
-                hourly_forecast = {
-                    "datetime": hourly.get("timestamp"),
-                    "native_temperature": hourly.get("temperature"),
-                    "native_precipitation": hourly.get("precipitation"),
-                    "precipitation_probability": hourly.get("precipitation_probability"),
-                    "native_wind_speed": hourly.get("wind_speed"),
-                    "wind_bearing": hourly.get("wind_direction"),
-                    "condition": ICON_TO_CONDITION_MAP.get(hourly.get("icon"), "unknown"),
-                    "humidity": hourly.get("humidity"),
-                    "native_pressure": hourly.get("pressure"),
-                    "uv_index": hourly.get("uv_index"),
-                    "native_apparent_temperature": hourly.get("feels_like"),
-                }
-                forecasts.append(hourly_forecast)
-        return forecasts
+        return self._cached_forecast("hourly", self._iter_forecast_hourly)
 
     @property
     def forecast_daily(self):
-        forecasts = []
-        for daily in self._forecast:
-            day_data = daily.get("daily", {})
-            daily_forecast = {
-                "datetime": day_data.get("timestamp"),
-                "native_temperature": day_data.get("temperature_max"),
-                "native_templow": day_data.get("temperature_min"),
-                "native_precipitation": day_data.get("precipitation_intensity"),
-                "precipitation_probability": day_data.get("precipitation_probability"),
-                "native_wind_speed": day_data.get("wind_speed"),
-                "wind_bearing": day_data.get("wind_direction"),
-                "condition": ICON_TO_CONDITION_MAP.get(day_data.get("icon"), "unknown"),
-                "humidity": day_data.get("humidity"),
-                "uv_index": day_data.get("uv_index"),
-                "native_pressure": day_data.get("pressure"),
+        return self._cached_forecast("daily", self._iter_forecast_daily)
+
+    def _hourly_window(self):
+        """Return the next hourly forecasts without converting the whole week."""
+        return self._cached_forecast("hourly_window", self._iter_forecast_hourly, HOURLY_FORECAST_LIMIT)
+
+    def _daily_window(self):
+        """Return the daily forecasts shown by the frontend."""
+        return self._cached_forecast("daily_window", self._iter_forecast_daily, DAILY_FORECAST_LIMIT)
+
+    def _iter_forecast_hourly(self):
+        for hourly in self._forecast.hourly.rows():
+            yield {
+                "datetime": hourly.timestamp,
+                "native_temperature": hourly.temperature,
+                "native_precipitation": hourly.precipitation,
+                "precipitation_probability": hourly.precipitation_probability,
+                "native_wind_speed": hourly.wind_speed,
+                "wind_bearing": hourly.wind_direction,
+                "condition": ICON_TO_CONDITION_MAP.get(hourly.icon, "unknown"),
+                "humidity": hourly.humidity,
+                "native_pressure": hourly.pressure,
+                "uv_index": hourly.uv_index,
+                "native_apparent_temperature": hourly.feels_like,
+            }
+
+    def _iter_forecast_daily(self):
+        for day_data in self._forecast.daily:
+            yield {
+                "datetime": day_data.timestamp,
+                "native_temperature": day_data.temperature_max,
+                "native_templow": day_data.temperature_min,
+                "native_precipitation": day_data.precipitation_intensity,
+                "precipitation_probability": day_data.precipitation_probability,
+                "native_wind_speed": day_data.wind_speed,
+                "wind_bearing": day_data.wind_direction,
+                "condition": ICON_TO_CONDITION_MAP.get(day_data.icon, "unknown"),
+                "humidity": day_data.humidity,
+                "uv_index": day_data.uv_index,
+                "native_pressure": day_data.pressure,
             }
-            forecasts.append(daily_forecast)
-        return forecasts
 
     @property
     def state(self):
         return self.condition
 
     async def async_forecast_daily(self):
-        return self.forecast_daily[:7]
+        return self._daily_window()
 
     async def async_forecast_hourly(self):
-        return self.forecast_hourly[:24]
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=self._alias,
-            manufacturer="WeatherXM",
-            model="Weather Station",
-        )
+        return self._hourly_window()
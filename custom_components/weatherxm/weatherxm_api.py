@@ -1,24 +1,629 @@
 """WeatherXM API Client."""
+import asyncio
+import base64
+import json
 import logging
-from datetime import datetime, timedelta
-from typing import Any
+import math
+import random
+import sys
+import time
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable
 
 import aiohttp
 
+from .metrics import ApiMetrics, EndpointMetrics
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_CACHE_TTL = 60
+DEFAULT_CACHE_SIZE = 128
+
+# Bodies at least this large (in bytes) are decoded in the executor
+DECODE_IN_EXECUTOR_THRESHOLD = 256 * 1024
+
+# Refresh the access token this many seconds before it expires
+TOKEN_REFRESH_MARGIN = 60
+
+# Request pacing and retries
+DEFAULT_RATE_LIMIT = 5
+DEFAULT_RATE_BURST = 10
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_REQUEST_TIMEOUT = 30
+BACKOFF_BASE = 1
+BACKOFF_MAX = 60
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Connector settings used when no session is injected
+CONNECTION_LIMIT_PER_HOST = 8
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 60
+
+
 class WeatherXMError(Exception):
     """Exception to indicate a WeatherXM API error."""
 
+
+@dataclass(slots=True)
+class CachedResponse:
+    """A cached API response and its validators."""
+
+    data: Any
+    expires: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def fresh(self) -> bool:
+        """Return True if the response can be served without asking the server."""
+        return time.monotonic() < self.expires
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Return the headers to revalidate this response."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Size bounded LRU cache of GET responses keyed by endpoint and params.
+
+    Responses are served straight from the cache while fresh, that is for the
+    Cache-Control max-age sent by the server or ``ttl`` seconds otherwise.
+    Stale responses carrying an ETag or Last-Modified validator are kept so the
+    next request can be made conditional and answered with a 304.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_CACHE_TTL, max_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """Initialize the cache."""
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple, CachedResponse] = OrderedDict()
+
+    @staticmethod
+    def key(endpoint: str, params: dict | None) -> tuple:
+        """Return the cache key for an endpoint and its query params."""
+        return (endpoint, tuple(sorted((params or {}).items())))
+
+    def get(self, key: tuple) -> CachedResponse | None:
+        """Return the cached response for key, if any."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not entry.fresh and not (entry.etag or entry.last_modified):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def store(self, key: tuple, data: Any, headers) -> None:
+        """Store a response, honoring its Cache-Control header."""
+        directives = _parse_cache_control(headers.get('Cache-Control', ''))
+        if 'no-store' in directives:
+            self._entries.pop(key, None)
+            return
+
+        ttl = self.ttl
+        if 'no-cache' in directives:
+            ttl = 0
+        elif 'max-age' in directives:
+            try:
+                ttl = max(int(directives['max-age']), 0)
+            except ValueError:
+                pass
+
+        self._entries[key] = CachedResponse(
+            data=data,
+            expires=time.monotonic() + ttl,
+            etag=headers.get('ETag'),
+            last_modified=headers.get('Last-Modified'),
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def refresh(self, key: tuple, entry: CachedResponse, headers) -> Any:
+        """Mark a cached response as revalidated by a 304 and return its data."""
+        self.store(key, entry.data, {
+            'Cache-Control': headers.get('Cache-Control', ''),
+            'ETag': headers.get('ETag', entry.etag),
+            'Last-Modified': headers.get('Last-Modified', entry.last_modified),
+        })
+        return entry.data
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._entries.clear()
+
+
+class _ApiModel:
+    """Flat model whose fields map one to one to keys of an API object.
+
+    Keys that are not declared as fields are dropped when parsing.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None):
+        """Parse an API object, using the field defaults for missing keys."""
+        data = data or {}
+        return cls(**{name: data[name] for name in cls.__match_args__ if name in data})
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the model as an API object."""
+        return {name: getattr(self, name) for name in self.__match_args__}
+
+
+@dataclass(slots=True)
+class CurrentWeather(_ApiModel):
+    """Latest observation of a station."""
+
+    timestamp: str | None = None
+    icon: str | None = None
+    temperature: float | None = None
+    feels_like: float | None = None
+    dew_point: float | None = None
+    humidity: float | None = None
+    pressure: float | None = None
+    precipitation: float | None = None
+    precipitation_accumulated: float | None = None
+    solar_irradiance: float | None = None
+    uv_index: float | None = None
+    wind_speed: float | None = None
+    wind_gust: float | None = None
+    wind_direction: float | None = None
+
+
+@dataclass(slots=True)
+class Rewards(_ApiModel):
+    """Rewards earned by a station."""
+
+    actual_reward: float = 0
+    total_rewards: float = 0
+
+
+@dataclass(slots=True)
+class Firmware(_ApiModel):
+    """Firmware versions of a station."""
+
+    current: str | None = None
+    assigned: str | None = None
+
+
+@dataclass(slots=True)
+class Location(_ApiModel):
+    """Coordinates of a station."""
+
+    lat: float | None = None
+    lon: float | None = None
+
+
+@dataclass(slots=True)
+class Device:
+    """A WeatherXM station as returned by me/devices."""
+
+    id: str
+    name: str
+    friendly_name: str | None = None
+    relation: str | None = None
+    address: str | None = None
+    bat_state: str | None = None
+    is_active: bool = False
+    last_activity: str | None = None
+    location: Location = field(default_factory=Location)
+    firmware: Firmware = field(default_factory=Firmware)
+    rewards: Rewards = field(default_factory=Rewards)
+    current_weather: CurrentWeather = field(default_factory=CurrentWeather)
+
+    @property
+    def alias(self) -> str:
+        """Return the friendly name set in the app, or the device name."""
+        return self.friendly_name or self.name
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Device":
+        """Parse a device object."""
+        attributes = data.get('attributes') or {}
+        return cls(
+            id=data['id'],
+            name=data['name'],
+            friendly_name=attributes.get('friendlyName'),
+            relation=data.get('relation'),
+            address=data.get('address'),
+            bat_state=data.get('bat_state'),
+            is_active=attributes.get('isActive', False),
+            last_activity=attributes.get('lastWeatherStationActivity'),
+            location=Location.from_dict(data.get('location')),
+            firmware=Firmware.from_dict(attributes.get('firmware')),
+            rewards=Rewards.from_dict(data.get('rewards')),
+            current_weather=CurrentWeather.from_dict(data.get('current_weather')),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the device as an API object holding only the parsed fields."""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'relation': self.relation,
+            'address': self.address,
+            'bat_state': self.bat_state,
+            'attributes': {
+                'friendlyName': self.friendly_name,
+                'isActive': self.is_active,
+                'lastWeatherStationActivity': self.last_activity,
+                'firmware': self.firmware.to_dict(),
+            },
+            'location': self.location.to_dict(),
+            'rewards': self.rewards.to_dict(),
+            'current_weather': self.current_weather.to_dict(),
+        }
+
+
+@dataclass(slots=True)
+class HourlyForecast(_ApiModel):
+    """Forecast for one hour."""
+
+    timestamp: str | None = None
+    icon: str | None = None
+    temperature: float | None = None
+    feels_like: float | None = None
+    humidity: float | None = None
+    pressure: float | None = None
+    precipitation: float | None = None
+    precipitation_probability: float | None = None
+    uv_index: float | None = None
+    wind_speed: float | None = None
+    wind_direction: float | None = None
+
+
+# Numeric fields of an hourly forecast, stored as one array('d') column each
+HOURLY_COLUMNS = (
+    'temperature',
+    'feels_like',
+    'humidity',
+    'pressure',
+    'precipitation',
+    'precipitation_probability',
+    'uv_index',
+    'wind_speed',
+    'wind_direction',
+)
+
+
+def _to_epoch(timestamp: str) -> int:
+    """Convert an ISO 8601 timestamp to UNIX seconds."""
+    return int(datetime.fromisoformat(timestamp).timestamp())
+
+
+def _to_column_value(value: Any) -> float:
+    """Return a value for an array('d') column, NaN standing for a missing value."""
+    return math.nan if value is None else float(value)
+
+
+def _from_column_value(value: float) -> float | None:
+    """Return a column value, or None if it is missing."""
+    return None if math.isnan(value) else value
+
+
+@dataclass(slots=True, eq=False)
+class HourlyForecastSeries:
+    """Hourly forecast stored column by column.
+
+    Timestamps are UNIX seconds in an array('q'), numeric fields live in one
+    array('d') per field and icons are interned strings. Rows are only
+    materialized as HourlyForecast objects for the window being read.
+    """
+
+    timestamps: array = field(default_factory=lambda: array('q'))
+    icons: tuple[str | None, ...] = ()
+    columns: dict[str, array] = field(
+        default_factory=lambda: {name: array('d') for name in HOURLY_COLUMNS}
+    )
+
+    def __len__(self) -> int:
+        """Return the number of hours."""
+        return len(self.timestamps)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare columns bytewise, so missing (NaN) values compare equal."""
+        if not isinstance(other, HourlyForecastSeries):
+            return NotImplemented
+        return (
+            self.timestamps == other.timestamps
+            and self.icons == other.icons
+            and all(
+                column.tobytes() == other.columns[name].tobytes()
+                for name, column in self.columns.items()
+            )
+        )
+
+    @classmethod
+    def from_rows(cls, rows) -> "HourlyForecastSeries":
+        """Build the series from hourly API objects, skipping rows without a timestamp."""
+        series = cls()
+        icons = []
+        for row in rows:
+            if not row.get('timestamp'):
+                continue
+            series.timestamps.append(_to_epoch(row['timestamp']))
+            icon = row.get('icon')
+            icons.append(sys.intern(icon) if icon else None)
+            for name, column in series.columns.items():
+                column.append(_to_column_value(row.get(name)))
+        series.icons = tuple(icons)
+        return series
+
+    def rows(self, start: int = 0, stop: int | None = None):
+        """Yield the hours in [start, stop) as HourlyForecast objects."""
+        columns = self.columns
+        for index in range(start, min(len(self), stop if stop is not None else len(self))):
+            yield HourlyForecast(
+                timestamp=datetime.fromtimestamp(self.timestamps[index], timezone.utc).isoformat(),
+                icon=self.icons[index],
+                **{name: _from_column_value(column[index]) for name, column in columns.items()},
+            )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, list] | None) -> "HourlyForecastSeries":
+        """Parse a series previously returned by to_dict."""
+        if not data:
+            return cls()
+        return cls(
+            timestamps=array('q', data['timestamp']),
+            icons=tuple(sys.intern(icon) if icon else None for icon in data['icon']),
+            columns={
+                name: array('d', (_to_column_value(value) for value in data[name]))
+                for name in HOURLY_COLUMNS
+            },
+        )
+
+    def to_dict(self) -> dict[str, list]:
+        """Return the series as a dict of column lists."""
+        data = {'timestamp': self.timestamps.tolist(), 'icon': list(self.icons)}
+        for name, column in self.columns.items():
+            data[name] = [_from_column_value(value) for value in column]
+        return data
+
+
+@dataclass(slots=True)
+class DailyForecast(_ApiModel):
+    """Forecast for one day."""
+
+    timestamp: str | None = None
+    icon: str | None = None
+    temperature_max: float | None = None
+    temperature_min: float | None = None
+    humidity: float | None = None
+    pressure: float | None = None
+    precipitation_intensity: float | None = None
+    precipitation_probability: float | None = None
+    uv_index: float | None = None
+    wind_speed: float | None = None
+    wind_direction: float | None = None
+
+
+@dataclass(slots=True)
+class Forecast:
+    """Hourly and daily forecast of a station."""
+
+    hourly: HourlyForecastSeries = field(default_factory=HourlyForecastSeries)
+    daily: tuple[DailyForecast, ...] = ()
+
+    @classmethod
+    def from_days(cls, days: list[dict[str, Any]] | None) -> "Forecast":
+        """Parse the list of forecast days returned by the forecast endpoint."""
+        days = days or []
+        return cls(
+            hourly=HourlyForecastSeries.from_rows(
+                hourly for day in days for hourly in day.get('hourly') or []
+            ),
+            daily=tuple(DailyForecast.from_dict(day.get('daily')) for day in days),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "Forecast":
+        """Parse a forecast previously returned by to_dict."""
+        data = data or {}
+        return cls(
+            hourly=HourlyForecastSeries.from_dict(data.get('hourly')),
+            daily=tuple(DailyForecast.from_dict(daily) for daily in data.get('daily', [])),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the forecast as hourly columns and daily rows."""
+        return {
+            'hourly': self.hourly.to_dict(),
+            'daily': [daily.to_dict() for daily in self.daily],
+        }
+
+
+class TokenBucket:
+    """Token bucket limiting the request rate to the API.
+
+    Up to ``capacity`` requests can be sent at once, after which requests are
+    paced at ``rate`` per second. pause() stops all requests for a while, e.g.
+    when the server answers 429 with a Retry-After header.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE_LIMIT, capacity: int = DEFAULT_RATE_BURST) -> None:
+        """Initialize the bucket, full."""
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request for the given number of seconds."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        while True:
+            now = time.monotonic()
+            if now < self._paused_until:
+                await asyncio.sleep(self._paused_until - now)
+                continue
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Return the delay requested by a Retry-After header, in seconds."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        return max((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds(), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Return a full-jitter exponential backoff delay for a retry attempt."""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+def default_json_decoder() -> Callable[[bytes], Any]:
+    """Return orjson.loads when available, json.loads otherwise."""
+    return orjson.loads if orjson is not None else json.loads
+
+
+def _decode_token_expiry(token: str) -> float | None:
+    """Return the expiry of a JWT as a UNIX timestamp, if it can be read."""
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))['exp'])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _parse_cache_control(value: str) -> dict[str, str | None]:
+    """Parse a Cache-Control header into a dict of directives."""
+    directives = {}
+    for part in value.split(','):
+        name, _, arg = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = arg.strip('"') or None
+    return directives
+
 class WeatherXMAPI:
     """WeatherXM API Client."""
 
-    def __init__(self, host: str) -> None:
-        """Initialize the API client."""
+    def __init__(
+        self,
+        host: str,
+        session: aiohttp.ClientSession | None = None,
+        cache: ResponseCache | None = None,
+        json_decoder: Callable[[bytes], Any] | None = None,
+        executor_threshold: int | None = DECODE_IN_EXECUTOR_THRESHOLD,
+        rate_limiter: TokenBucket | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+    ) -> None:
+        """Initialize the API client.
+
+        Pass Home Assistant's shared session to reuse its connection pool.
+        Without one, the client creates its own session with keep-alive, DNS
+        caching and a per-host connection limit, and closes it on close().
+
+        Response bodies are decoded with json_decoder (orjson when available).
+        Bodies of at least executor_threshold bytes are decoded in the default
+        executor so large forecasts do not block the event loop; pass None to
+        always decode inline.
+
+        Requests are paced by rate_limiter and time out after request_timeout
+        seconds. Timeouts, connection errors, 429 and 5xx answers are retried
+        up to max_retries times with jittered exponential backoff, honoring
+        Retry-After up to BACKOFF_MAX seconds; longer waits raise WeatherXMError.
+
+        Latency, retries, bytes and decode time are counted per endpoint in
+        metrics.
+        """
         self.host = host
-        self._session = aiohttp.ClientSession()
+        self._owns_session = session is None
+        self._session = session if session is not None else self._create_session()
         self._auth_token = None
         self._refresh_token = None
+        self._token_expiry = None
+        self._refresh_lock = asyncio.Lock()
+        # Called whenever the tokens change, so they can be persisted
+        self.on_tokens_updated: Callable[[], None] | None = None
+        self._cache = cache if cache is not None else ResponseCache()
+        self._json_decoder = json_decoder or default_json_decoder()
+        self._executor_threshold = executor_threshold
+        self._rate_limiter = rate_limiter if rate_limiter is not None else TokenBucket()
+        self._max_retries = max_retries
+        self._timeout = aiohttp.ClientTimeout(total=request_timeout)
+        self.metrics = ApiMetrics()
+
+    @staticmethod
+    def _create_session() -> aiohttp.ClientSession:
+        """Create a session with a connector tuned for a single API host."""
+        connector = aiohttp.TCPConnector(
+            limit_per_host=CONNECTION_LIMIT_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+    @property
+    def token_valid(self) -> bool:
+        """Return True if the access token is known and not expired."""
+        if not self._auth_token:
+            return False
+        return self._token_expiry is None or self._token_expiry > time.time()
+
+    @property
+    def has_refresh_token(self) -> bool:
+        """Return True if a refresh token is available."""
+        return self._refresh_token is not None
+
+    def export_tokens(self) -> dict[str, Any]:
+        """Return the current tokens in a serializable form."""
+        return {
+            'token': self._auth_token,
+            'refreshToken': self._refresh_token,
+            'expires': self._token_expiry,
+        }
+
+    def restore_tokens(self, data: dict[str, Any] | None) -> None:
+        """Restore tokens previously returned by export_tokens."""
+        if not data:
+            return
+        self._auth_token = data.get('token')
+        self._refresh_token = data.get('refreshToken')
+        self._token_expiry = data.get('expires')
+
+    def _set_tokens(self, token: str | None, refresh_token: str | None) -> None:
+        """Store new tokens and notify the listener."""
+        self._auth_token = token
+        self._refresh_token = refresh_token
+        self._token_expiry = _decode_token_expiry(token) if token else None
+        if self.on_tokens_updated:
+            self.on_tokens_updated()
 
     async def authenticate(self, username: str, password: str) -> bool:
         """Authenticate with WeatherXM API."""
@@ -32,19 +637,19 @@ class WeatherXMAPI:
             async with self._session.post(
                 f'{self.host}/api/v1/auth/login',
                 json=data,
-                headers=headers
+                headers=headers,
+                timeout=self._timeout,
             ) as response:
                 if response.status == 200:
                     result = await response.json()
-                    self._auth_token = result['token']
-                    self._refresh_token = result['refreshToken']
+                    self._set_tokens(result['token'], result['refreshToken'])
                     return True
                 else:
                     error = await response.text()
                     _LOGGER.error("Authentication failed: %s", error)
                     return False
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Error during authentication: %s", err)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.error("Error during authentication: %r", err)
             return False
 
     async def refresh_token(self) -> bool:
@@ -63,93 +668,223 @@ class WeatherXMAPI:
             async with self._session.post(
                 f'{self.host}/api/v1/auth/refresh',
                 json=data,
-                headers=headers
+                headers=headers,
+                timeout=self._timeout,
             ) as response:
                 if response.status == 200:
                     result = await response.json()
-                    self._auth_token = result['token']
-                    self._refresh_token = result['refreshToken']
+                    self._set_tokens(result['token'], result['refreshToken'])
                     return True
                 else:
                     error = await response.text()
                     _LOGGER.error("Token refresh failed: %s", error)
                     # Clear tokens on refresh failure
-                    self._auth_token = None
-                    self._refresh_token = None
+                    self._set_tokens(None, None)
                     return False
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Error during token refresh: %s", err)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.error("Error during token refresh: %r", err)
             return False
 
-    async def _request(self, method: str, endpoint: str, **kwargs) -> Any:
-        """Make an API request with automatic token refresh."""
+    async def _async_refresh_once(self, stale_token: str | None) -> bool:
+        """Refresh the tokens unless another caller already did.
+
+        Concurrent callers wait on the same lock, so only one refresh request
+        is in flight; the others reuse its result.
+        """
+        async with self._refresh_lock:
+            if self._auth_token and self._auth_token != stale_token:
+                return True
+            return await self.refresh_token()
+
+    async def _async_ensure_token(self) -> str:
+        """Return a usable access token, refreshing it shortly before it expires."""
         if not self._auth_token:
             raise WeatherXMError("Not authenticated")
 
+        if (
+            self._token_expiry is not None
+            and self._token_expiry - TOKEN_REFRESH_MARGIN <= time.time()
+        ):
+            _LOGGER.debug("Token about to expire, refreshing")
+            if not await self._async_refresh_once(self._auth_token):
+                raise WeatherXMError("Token refresh failed")
+
+        return self._auth_token
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Make an API request with token refresh, caching, pacing and retries."""
+        stats = self.metrics.endpoint(endpoint)
+        cache_key = None
+        cached = None
+        if method == 'GET':
+            cache_key = self._cache.key(endpoint, kwargs.get('params'))
+            cached = self._cache.get(cache_key)
+            if cached and cached.fresh:
+                _LOGGER.debug("Serving %s from cache", endpoint)
+                stats.cache_hits += 1
+                return cached.data
+
         headers = kwargs.pop('headers', {})
-        headers['Authorization'] = f'Bearer {self._auth_token}'
         headers['accept'] = 'application/json'
+        if cached:
+            headers.update(cached.conditional_headers())
 
         url = f'{self.host}/api/v1/{endpoint}'
-        _LOGGER.debug("Making API request to %s", endpoint)
+        attempt = 0
+        token_refreshed = False
 
-        try:
-            async with self._session.request(
-                method,
-                url,
-                headers=headers,
-                **kwargs
-            ) as response:
-                if response.status == 401:
-                    _LOGGER.debug("Token expired, attempting refresh")
-                    # Token expired, try to refresh
-                    if await self.refresh_token():
-                        # Retry request with new token
-                        _LOGGER.debug("Token refreshed, retrying request")
-                        headers['Authorization'] = f'Bearer {self._auth_token}'
-                        async with self._session.request(
-                            method,
-                            url,
-                            headers=headers,
-                            **kwargs
-                        ) as retry_response:
-                            return await retry_response.json()
-                    else:
-                        raise WeatherXMError("Token refresh failed")
-                elif response.status == 200:
-                    _LOGGER.debug("API request successful")
-                    return await response.json()
-                else:
-                    error = await response.text()
-                    _LOGGER.error("API request failed with status %s: %s", response.status, error)
-                    raise WeatherXMError(f"API request failed: {error}")
-        except aiohttp.ClientError as err:
-            raise WeatherXMError(f"Request error: {err}")
+        while True:
+            token = await self._async_ensure_token()
+            headers['Authorization'] = f'Bearer {token}'
+            await self._rate_limiter.acquire()
+            _LOGGER.debug("Making API request to %s", endpoint)
+            stats.requests += 1
+            start = time.perf_counter()
+
+            try:
+                async with self._session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    timeout=self._timeout,
+                    **kwargs
+                ) as response:
+                    stats.latency.record(time.perf_counter() - start)
+                    if response.status == 401 and not token_refreshed:
+                        _LOGGER.debug("Token rejected, attempting refresh")
+                        # Token revoked or expired early, refresh and retry once
+                        if not await self._async_refresh_once(token):
+                            raise WeatherXMError("Token refresh failed")
+                        token_refreshed = True
+                        continue
+                    if response.status not in RETRY_STATUSES or attempt >= self._max_retries:
+                        return await self._handle_response(response, cache_key, cached, stats)
+                    stats.errors += 1
+                    retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                    if retry_after is not None and retry_after > BACKOFF_MAX:
+                        # Fail this refresh instead of stalling every request;
+                        # the coordinator schedule retries later
+                        raise WeatherXMError(
+                            f"API asked to retry {endpoint} in {retry_after:.0f}s, giving up"
+                        )
+                    delay = min(retry_after, BACKOFF_MAX) if retry_after is not None else _backoff_delay(attempt)
+                    if response.status == 429:
+                        self._rate_limiter.pause(delay)
+                    _LOGGER.debug(
+                        "API request to %s failed with status %s, retrying in %.1fs",
+                        endpoint, response.status, delay,
+                    )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                stats.errors += 1
+                if attempt >= self._max_retries:
+                    raise WeatherXMError(f"Request error: {err!r}") from err
+                delay = _backoff_delay(attempt)
+                _LOGGER.debug("API request to %s failed (%r), retrying in %.1fs", endpoint, err, delay)
+
+            attempt += 1
+            stats.retries += 1
+            await asyncio.sleep(delay)
+
+    async def _handle_response(
+        self,
+        response: aiohttp.ClientResponse,
+        cache_key: tuple | None,
+        cached: CachedResponse | None,
+        stats: EndpointMetrics,
+    ) -> Any:
+        """Return the payload of a response, using the cached one on 304."""
+        if response.status == 304 and cached is not None:
+            _LOGGER.debug("API response not modified, using cached data")
+            stats.not_modified += 1
+            return self._cache.refresh(cache_key, cached, response.headers)
+        if response.status == 200:
+            _LOGGER.debug("API request successful")
+            data = await self._decode(response, stats)
+            if cache_key is not None:
+                self._cache.store(cache_key, data, response.headers)
+            return data
+        stats.errors += 1
+        error = await response.text()
+        _LOGGER.error("API request failed with status %s: %s", response.status, error)
+        raise WeatherXMError(f"API request failed: {error}")
+
+    async def _decode(self, response: aiohttp.ClientResponse, stats: EndpointMetrics) -> Any:
+        """Decode a JSON body, off the event loop if it is large."""
+        body = await response.read()
+        stats.bytes += len(body)
+        start = time.perf_counter()
+        if self._executor_threshold is not None and len(body) >= self._executor_threshold:
+            _LOGGER.debug("Decoding %s bytes in the executor", len(body))
+            data = await asyncio.get_running_loop().run_in_executor(None, self._json_decoder, body)
+        else:
+            data = self._json_decoder(body)
+        stats.decode.record(time.perf_counter() - start)
+        return data
 
-    async def get_devices(self) -> list:
-        """Get user's devices."""
+    async def get_devices(self, errors: dict[str, Exception] | None = None) -> list[Device]:
+        """Get user's devices.
+
+        Each device is parsed on its own: a malformed device is skipped and,
+        if it has an id, its error is added to errors. Request errors are
+        raised as WeatherXMError.
+        """
+        devices = []
+        for data in await self._request('GET', 'me/devices') or []:
+            try:
+                devices.append(Device.from_dict(data))
+            except (AttributeError, KeyError, TypeError, ValueError) as err:
+                device_id = data.get('id') if isinstance(data, dict) else None
+                _LOGGER.warning("Skipping malformed device %s: %r", device_id, err)
+                if errors is not None and device_id:
+                    errors[device_id] = err
+        return devices
+
+    async def get_device(self, device_id: str) -> Device:
+        """Get a single device of the user.
+
+        Request and parse errors are raised as WeatherXMError.
+        """
+        data = await self._request('GET', f'me/devices/{device_id}')
         try:
-            return await self._request('GET', 'me/devices')
-        except WeatherXMError as err:
-            _LOGGER.error("Failed to get devices: %s", err)
-            return []
+            return Device.from_dict(data)
+        except (AttributeError, KeyError, TypeError, ValueError) as err:
+            raise WeatherXMError(f"Malformed device {device_id}: {err!r}") from err
+
+    async def get_forecast_data(self, device_id: str) -> Forecast:
+        """Get forecast data for a device.
 
-    async def get_forecast_data(self, device_id: str) -> dict:
-        """Get forecast data for a device."""
+        Errors are raised as WeatherXMError so callers fetching several
+        devices can decide how to handle a single failure.
+        """
         today = datetime.now().strftime('%Y-%m-%d')
         future = (datetime.now() + timedelta(days=7)).strftime('%Y-%m-%d')
 
-        try:
-            return await self._request(
-                'GET',
-                f'me/devices/{device_id}/forecast',
-                params={'fromDate': today, 'toDate': future}
-            )
-        except WeatherXMError as err:
-            _LOGGER.error("Failed to get forecast data: %s", err)
-            return {}
+        return Forecast.from_days(await self._request(
+            'GET',
+            f'me/devices/{device_id}/forecast',
+            params={'fromDate': today, 'toDate': future}
+        ))
+
+    async def get_history(self, device_id: str, from_date: date, to_date: date) -> list[CurrentWeather]:
+        """Get the hourly observations of a device between two dates, inclusive.
+
+        Errors are raised as WeatherXMError.
+        """
+        days = await self._request(
+            'GET',
+            f'me/devices/{device_id}/history',
+            params={'fromDate': from_date.isoformat(), 'toDate': to_date.isoformat()}
+        )
+        return [
+            CurrentWeather.from_dict(hourly)
+            for day in days or []
+            for hourly in day.get('hourly') or []
+            if hourly.get('timestamp')
+        ]
 
     async def close(self) -> None:
         """Close the API client."""
-        if self._session:
+        self._cache.clear()
+        # A shared session belongs to Home Assistant, never close it here
+        if self._session and self._owns_session:
             await self._session.close()